@@ -1,12 +1,11 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import datetime
 import time
-from utils.data_loader import load_all_data
-
+from utils.tracing import end_trace, section, start_trace, traced_fragment
+from utils.welcome import load_welcome_metrics, warm_data_in_background
 
+start_trace("Navigation")
 
+section("css")
 st.markdown("""
 <style>
 /* ===== MOBILE RESPONSIVENESS ===== */
@@ -64,24 +63,6 @@ div[data-testid="stAlert"] p {
 }
 </style>
 """, unsafe_allow_html=True)
-# ==================================================
-@st.cache_data
-def load_countries():
-    return pd.read_csv("data/countries.csv")
-
-@st.cache_data
-def load_programs():
-    return pd.read_csv("data/programs.csv")
-
-@st.cache_data
-def load_metrics():
-    return pd.read_csv("data/global_metrics.csv")
-
-countries_df = load_countries()
-programs_df = load_programs()
-metrics_df = load_metrics()
-#st.write("METRICS CSV COLUMNS 👉", metrics_df.columns.tolist())
-#st.stop()
 
 # ==================================================
 # SESSION STATE
@@ -145,7 +126,7 @@ def count_up(target, suffix="", duration=0.8):
 # WELCOME PAGE
 # ==================================================
 def render_welcome_page():
-
+    section("welcome css")
     st.markdown("""
     <style>
     .hero {
@@ -186,6 +167,7 @@ def render_welcome_page():
     """, unsafe_allow_html=True)
 
     # ---------------- HERO ----------------
+    section("welcome hero")
     st.markdown("""
     <div class="hero">
         <h1>Global Field Epidemiology Intelligence Platform(da.zx@outlook.com)</h1>
@@ -200,6 +182,7 @@ def render_welcome_page():
     st.markdown("<br>", unsafe_allow_html=True)
 
     # ---------------- ROLE SELECT ----------------
+    section("welcome role select")
     st.subheader("Select Access Profile")
 
     role = st.selectbox(
@@ -210,14 +193,16 @@ def render_welcome_page():
     st.info(ROLES[role])
 
     # ---------------- METRICS ----------------
+    section("welcome metrics")
     st.markdown("### Global System Snapshot")
-    cols = st.columns(len(metrics_df))
+    metrics = load_welcome_metrics()
+    cols = st.columns(len(metrics))
 
-    for col, (_, row) in zip(cols, metrics_df.iterrows()):
+    for col, (metric, value) in zip(cols, metrics):
         with col:
             st.metric(
-                label=row["metric"],
-                value=row["value"]
+                label=metric,
+                value=value
             )
 
     # cols = st.columns(4)
@@ -247,6 +232,7 @@ def render_welcome_page():
 
 
     # ---------------- TICKER ----------------
+    section("welcome ticker")
     st.markdown("""
     <style>
     /* ---- GLOBAL TICKER FIX ---- */
@@ -309,16 +295,30 @@ def render_welcome_page():
 # ROUTER
 # ==================================================
 if not st.session_state.entered:
+    # The gate needs no dataset: parse it in the background meanwhile
+    warm_data_in_background()
     render_welcome_page()
+    end_trace()
     st.stop()
 
 
+# ==================================================
+# DATA (loaded once the welcome gate is passed)
+# ==================================================
+# Shared, read-only tables (parsed once per process, see utils/repository.py)
+section("load data")
+from utils.readiness import INVESTMENT_PRIORITIES, RECOMMENDATIONS, load_readiness_table
+from utils.repository import get_repository
 
+repo = get_repository()
+
+countries_df = repo["countries"]
+with st.spinner("Computing country readiness..."):
+    readiness_df = load_readiness_table(repo.version)
 
-def render_dashboard():
-    # SIDEBAR (only visible after entry)
-    st.sidebar.markdown("## 🌍 Dashboard Controls")
 
+def render_dashboard():
+    section("dashboard sidebar")
     selected = st.sidebar.selectbox(
         "Select Country",
         options=sorted(countries_df["country"].unique()),
@@ -331,18 +331,15 @@ def render_dashboard():
     st.session_state.selected_country = selected
 
     # MAIN CONTENT
-    st.markdown(
-        f"## 🇳🇬 Country Overview: {st.session_state.selected_country}"
-    )
-
-    country_programs = programs_df[
-        programs_df["country"] == st.session_state.selected_country
-        ]
+    with country_overview:
+        st.markdown(
+            f"## 🇳🇬 Country Overview: {st.session_state.selected_country}"
+        )
 
-    st.metric(
-        "Active FETP Programs",
-        len(country_programs)
-    )
+        st.metric(
+            "Active FETP Programs",
+            readiness_df.loc[st.session_state.selected_country, "num_programs"]
+        )
 
 
 # ==================================================
@@ -353,12 +350,17 @@ st.caption(f"Access Profile: {st.session_state.role}")
 
 st.success("Dashboard content now loads based on role permissions.")
 
-render_dashboard()
+# SIDEBAR (only visible after entry)
+st.sidebar.markdown("## 🌍 Dashboard Controls")
+
+# Filled by render_dashboard() from the country fragment below
+country_overview = st.container()
 # ==================================================
 # WELCOME GATE ROUTER (STOP EXECUTION)
 # ==================================================
 if not st.session_state.entered:
     render_welcome_page()
+    end_trace()
     st.stop()
 
 
@@ -371,6 +373,7 @@ if not st.session_state.entered:
 # ==================================================
 # MAIN LANDING PAGE CONTENT
 # ==================================================
+section("landing content")
 st.image("assets/logo.png", width=120)
 st.info(
     "Use the sidebar to navigate between sections. "
@@ -399,345 +402,179 @@ All pages are synchronized using the **country selector on the left** to provide
 
 
 # ==================================================
-# COUNTRY SNAPSHOT (EXECUTIVE SUMMARY)
-# ==================================================
-selected_country = st.session_state.selected_country
-
-country_programs = programs_df[programs_df["country"] == selected_country]
-country_meta = countries_df[countries_df["country"] == selected_country]
-
-# --------------------------------------------------
-# DERIVED METRICS
-# --------------------------------------------------
-num_programs = len(country_programs)
-num_accredited = (country_programs["accredited"] == "Yes").sum()
-modalities = country_programs["modality"].dropna().unique()
-
-current_year = datetime.now().year
-
-if not country_programs.empty:
-    years_active = current_year - country_programs["established"].min()
-else:
-    years_active = 0
-
+# COUNTRY SECTIONS (FRAGMENT)
 # ==================================================
-# COUNTRY-SPECIFIC GOVERNANCE & READINESS METRICS
-# (MUST BE DEFINED BEFORE FLOWCHART UI)
-# ==================================================
-
-# Defensive check
-if country_programs.empty:
-    host_institutions = []
-    total_programs = 0
-    accredited_programs = 0
-    modalities_present = []
-    network_membership = []
-    years_active = 0
-else:
-    # Host institutions
-    host_institutions = (
-        country_programs["host_institution"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
-
-    # Program counts
-    total_programs = len(country_programs)
-    accredited_programs = (
-        country_programs["accredited"].str.lower() == "yes"
-    ).sum()
-
-    # Modalities
-    modalities_present = (
-        country_programs["modality"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
-
-    # Network participation
-    network_membership = (
-        country_programs["network"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
+# Everything that depends on the selected country reruns on its own when
+# the sidebar selector changes; the landing content above stays as is.
+@st.fragment
+@traced_fragment("Navigation: country")
+def render_country_sections():
+    render_dashboard()
 
-    # Institutional maturity proxy
-    years_active = (
-        2025 - country_programs["established"].min()
-        if pd.notna(country_programs["established"].min())
-        else 0
-    )
-
-
-# --------------------------------------------------
-# CREDENTIALING READINESS SCORE (0–100)
-# --------------------------------------------------
-
-# 1. Program maturity (max 30)
-maturity_score = min((years_active / 25) * 30, 30)
-
-# 2. Accreditation strength (max 30)
-accreditation_score = (
-    (num_accredited / num_programs) * 30 if num_programs > 0 else 0
-)
-
-# 3. Modality breadth (max 20)
-modality_score = min(len(modalities) / 3 * 20, 20)
-
-# 4. Network integration (max 20)
-network_score = (
-    20 if country_programs["tephinet_member"].eq("Yes").any() else 0
-)
-
-# Final score
-readiness_score = round(
-    maturity_score + accreditation_score + modality_score + network_score
-)
-
-# Color & label
-if readiness_score >= 75:
-    readiness_color = "🟢"
-    readiness_label = "High Readiness"
-elif readiness_score >= 50:
-    readiness_color = "🟠"
-    readiness_label = "Moderate Readiness"
-else:
-    readiness_color = "🔴"
-    readiness_label = "Emerging Readiness"
+    # ==================================================
+    # COUNTRY SNAPSHOT (EXECUTIVE SUMMARY)
+    # ==================================================
+    section("readiness lookup")
+    selected_country = st.session_state.selected_country
+
+    # Every country is scored up front (utils/readiness.py); switching
+    # country is a row lookup in that table.
+    country_readiness = readiness_df.loc[selected_country]
+
+    num_programs = country_readiness["num_programs"]
+    num_accredited = country_readiness["num_accredited"]
+    modalities = country_readiness["modalities"]
+    years_active = country_readiness["years_active"]
+
+    # Governance & readiness metrics (used by the flowchart UI below)
+    host_institutions = country_readiness["host_institutions"]
+    total_programs = num_programs
+    accredited_programs = num_accredited
+    modalities_present = modalities
+    network_membership = country_readiness["networks"]
+
+    # --------------------------------------------------
+    # CREDENTIALING READINESS SCORE (0–100)
+    # --------------------------------------------------
+    maturity_score = country_readiness["maturity_score"]
+    accreditation_score = country_readiness["accreditation_score"]
+    modality_score = country_readiness["modality_score"]
+    network_score = country_readiness["network_score"]
+
+    readiness_score = country_readiness["readiness_score"]
+    readiness_color = country_readiness["readiness_color"]
+    readiness_label = country_readiness["readiness_label"]
 
-# ==================================================
-# SNAPSHOT UI
-# ==================================================
-st.markdown(f"## 📍 Country Snapshot — **{selected_country}**")
+    # ==================================================
+    # SNAPSHOT UI
+    # ==================================================
+    section("snapshot ui")
+    st.markdown(f"## 📍 Country Snapshot — **{selected_country}**")
 
-col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4 = st.columns(4)
 
-with col1:
-    st.metric(
-        label="WHO Region",
-        value=country_meta["who_region"].values[0]
-    )
+    with col1:
+        st.metric(
+            label="WHO Region",
+            value=country_readiness["who_region"]
+        )
 
-with col2:
-    st.metric(
-        label="Active Training Programs",
-        value=num_programs
-    )
+    with col2:
+        st.metric(
+            label="Active Training Programs",
+            value=num_programs
+        )
 
-with col3:
-    st.metric(
-        label="Accredited Programs",
-        value=num_accredited
-    )
+    with col3:
+        st.metric(
+            label="Accredited Programs",
+            value=num_accredited
+        )
 
-with col4:
-    st.metric(
-        label="Readiness Score",
-        value=f"{readiness_score}/100"
-    )
+    with col4:
+        st.metric(
+            label="Readiness Score",
+            value=f"{readiness_score}/100"
+        )
 
-# --------------------------------------------------
-# READINESS DETAIL PANEL
-# --------------------------------------------------
-st.markdown("### 🧭 Credentialing Readiness Index")
+    # --------------------------------------------------
+    # READINESS DETAIL PANEL
+    # --------------------------------------------------
+    st.markdown("### 🧭 Credentialing Readiness Index")
 
-left, right = st.columns([1, 3])
+    left, right = st.columns([1, 3])
 
-with left:
-    st.markdown(
-        f"""
+    with left:
+        st.markdown(
+            f"""
         ## {readiness_color}  
         **{readiness_label}**
         """
-    )
+        )
 
-with right:
-    st.markdown(
-        f"""
+    with right:
+        st.markdown(
+            f"""
         **Score breakdown**
         - 🏛 Program maturity: **{round(maturity_score,1)} / 30**
         - 🏅 Accreditation strength: **{round(accreditation_score,1)} / 30**
         - 🎓 Modality breadth: **{round(modality_score,1)} / 20**
         - 🌐 Network integration: **{round(network_score,1)} / 20**
         """
-    )
-
-# --------------------------------------------------
-# MODALITIES SUMMARY
-# --------------------------------------------------
-if len(modalities) > 0:
-    st.markdown(
-        f"**Training modalities present:** {', '.join(modalities)}"
-    )
-else:
-    st.markdown("**Training modalities present:** Not specified")
-
-st.info(
-    "This snapshot provides a high-level executive overview. "
-    "Navigate to other sections for detailed maps, governance flows, "
-    "and program-level diagnostics."
-)
-# ==================================================
-# COUNTRY-SPECIFIC READINESS RECOMMENDATIONS
-# ==================================================
-st.markdown("## 🛠 Country-Specific Readiness Recommendations")
-
-recommendations = []
-
-# Accreditation gap
-if num_programs > 0 and num_accredited == 0:
-    recommendations.append(
-        "🏅 **Expand accreditation**: No accredited programs detected. "
-        "Prioritize accreditation pathways with regional or global bodies."
-    )
-
-elif num_programs > num_accredited:
-    recommendations.append(
-        "🏅 **Scale accreditation coverage**: Some programs remain unaccredited. "
-        "Target these for phased accreditation."
-    )
-
-# Modality gap
-if len(modalities) == 1:
-    recommendations.append(
-        "🎓 **Introduce additional training modalities**: "
-        "Expand beyond a single modality (e.g., add Intermediate or Advanced levels)."
-    )
-
-elif len(modalities) == 2:
-    recommendations.append(
-        "🎓 **Complete modality ladder**: "
-        "Introduce the missing training tier to ensure workforce progression."
-    )
-
-# Program maturity
-if years_active < 5:
-    recommendations.append(
-        "🏛 **Strengthen program maturity**: "
-        "Programs are relatively new. Focus on governance structures, faculty development, "
-        "and curriculum standardization."
-    )
-
-# Network integration
-if network_score == 0:
-    recommendations.append(
-        "🌐 **Strengthen regional integration**: "
-        "Country programs are not currently linked to regional or global FETP networks "
-        "(e.g., TEPHINET)."
-    )
-
-# High readiness refinement
-if readiness_score >= 75:
-    recommendations.append(
-        "🚀 **Advance to regional leadership**: "
-        "Position the country as a regional training hub and mentorship center."
-    )
-
-# --------------------------------------------------
-# DISPLAY RECOMMENDATIONS
-# --------------------------------------------------
-if recommendations:
-    for rec in recommendations:
-        st.markdown(f"- {rec}")
-else:
-    st.success(
-        "This country demonstrates strong readiness across all assessed dimensions. "
-        "Focus on sustainability, innovation, and regional leadership."
-    )
-
-# ==================================================
-# AUTO-GENERATED DONOR INVESTMENT PRIORITIES
-# ==================================================
-st.markdown("## 💰 Donor Investment Priorities")
-
-investment_priorities = []
-
-# Accreditation investment
-if num_accredited == 0:
-    investment_priorities.append(
-        "**Accreditation systems strengthening** — Support accreditation fees, "
-        "technical assistance, and quality assurance systems."
-    )
-
-elif num_accredited < num_programs:
-    investment_priorities.append(
-        "**Accreditation scale-up** — Fund phased accreditation of remaining programs."
-    )
-
-# Workforce pipeline
-if len(modalities) < 3:
-    investment_priorities.append(
-        "**Workforce pipeline expansion** — Invest in Intermediate and Advanced training "
-        "modalities to strengthen career progression."
-    )
-
-# Institutional maturity
-if years_active < 5:
-    investment_priorities.append(
-        "**Institutional capacity building** — Support faculty development, "
-        "program governance, and curriculum standardization."
-    )
-
-# Network & global integration
-if network_score == 0:
-    investment_priorities.append(
-        "**Regional & global integration** — Enable participation in networks "
-        "such as TEPHINET and GFEP initiatives."
-    )
+        )
 
-# High readiness countries
-if readiness_score >= 75:
-    investment_priorities.append(
-        "**Regional leadership & south–south cooperation** — Fund the country "
-        "to serve as a regional training hub and mentorship center."
-    )
+    # --------------------------------------------------
+    # MODALITIES SUMMARY
+    # --------------------------------------------------
+    if len(modalities) > 0:
+        st.markdown(
+            f"**Training modalities present:** {', '.join(modalities)}"
+        )
+    else:
+        st.markdown("**Training modalities present:** Not specified")
 
-# --------------------------------------------------
-# DISPLAY
-# --------------------------------------------------
-if investment_priorities:
-    for item in investment_priorities:
-        st.markdown(f"- {item}")
-else:
-    st.success(
-        "This country is well-positioned for innovation-focused investments, "
-        "including digital epidemiology, research translation, and regional leadership."
+    st.info(
+        "This snapshot provides a high-level executive overview. "
+        "Navigate to other sections for detailed maps, governance flows, "
+        "and program-level diagnostics."
     )
-
     # ==================================================
-    # COUNTRY-SPECIFIC GOVERNANCE METRICS
+    # COUNTRY-SPECIFIC READINESS RECOMMENDATIONS
     # ==================================================
+    section("recommendations")
+    st.markdown("## 🛠 Country-Specific Readiness Recommendations")
+
+    recommendations = [RECOMMENDATIONS[code] for code in country_readiness["recommendations"]]
+
+    # --------------------------------------------------
+    # DISPLAY RECOMMENDATIONS
+    # --------------------------------------------------
+    if recommendations:
+        for rec in recommendations:
+            st.markdown(f"- {rec}")
+    else:
+        st.success(
+            "This country demonstrates strong readiness across all assessed dimensions. "
+            "Focus on sustainability, innovation, and regional leadership."
+        )
 
-    # Host institutions
-    host_institutions = country_programs["host_institution"].dropna().unique()
-
-    # Accreditation metrics
-    total_programs = len(country_programs)
-    accredited_programs = (country_programs["accredited"] == "Yes").sum()
-
-    # Modalities present
-    modalities_present = sorted(country_programs["modality"].dropna().unique())
-
-    # Network participation
-    network_membership = country_programs["network"].dropna().unique()
-    network_score = len(network_membership)
-
-    # Institutional maturity proxy
-    years_active = 2025 - country_programs["established"].min() if total_programs > 0 else 0
+    # ==================================================
+    # AUTO-GENERATED DONOR INVESTMENT PRIORITIES
+    # ==================================================
+    section("investment priorities")
+    st.markdown("## 💰 Donor Investment Priorities")
+
+    investment_priorities = [
+        INVESTMENT_PRIORITIES[code] for code in country_readiness["investment_priorities"]
+    ]
+
+    # --------------------------------------------------
+    # DISPLAY
+    # --------------------------------------------------
+    if investment_priorities:
+        for item in investment_priorities:
+            st.markdown(f"- {item}")
+    else:
+        st.success(
+            "This country is well-positioned for innovation-focused investments, "
+            "including digital epidemiology, research translation, and regional leadership."
+        )
 
-# ==================================================
-# GOVERNANCE & ACCREDITATION PATHWAY (COUNTRY-AWARE)
-# ==================================================
-st.markdown("## 🏛 Governance & Accreditation Pathway")
+        # Governance panel counts represented networks rather than TEPHINET membership here
+        modalities_present = sorted(modalities_present)
+        network_score = len(network_membership)
 
-# --------------------------------------------------
-# NATIONAL GOVERNANCE
-# --------------------------------------------------
-with st.expander("📜 National Governance Structure"):
-    st.markdown(f"""
+    # ==================================================
+    # GOVERNANCE & ACCREDITATION PATHWAY (COUNTRY-AWARE)
+    # ==================================================
+    section("governance pathway")
+    st.markdown("## 🏛 Governance & Accreditation Pathway")
+
+    # --------------------------------------------------
+    # NATIONAL GOVERNANCE
+    # --------------------------------------------------
+    with st.expander("📜 National Governance Structure"):
+        st.markdown(f"""
     **Country:** {selected_country}
 
     **Lead Institutions:**
@@ -749,11 +586,11 @@ with st.expander("📜 National Governance Structure"):
     - Years active (approx.): {years_active}
     """)
 
-# --------------------------------------------------
-# TRAINING IMPLEMENTATION
-# --------------------------------------------------
-with st.expander("🎓 Training Program Implementation"):
-    st.markdown(f"""
+    # --------------------------------------------------
+    # TRAINING IMPLEMENTATION
+    # --------------------------------------------------
+    with st.expander("🎓 Training Program Implementation"):
+        st.markdown(f"""
     **Training modalities currently implemented:**
     {", ".join(modalities_present) if modalities_present else "No formal modalities recorded"}
 
@@ -761,11 +598,11 @@ with st.expander("🎓 Training Program Implementation"):
     {"Full pipeline coverage" if len(modalities_present) >= 3 else "Partial training pipeline — expansion recommended"}
     """)
 
-# --------------------------------------------------
-# ACCREDITATION STATUS
-# --------------------------------------------------
-with st.expander("🏅 Accreditation & Quality Assurance"):
-    st.markdown(f"""
+    # --------------------------------------------------
+    # ACCREDITATION STATUS
+    # --------------------------------------------------
+    with st.expander("🏅 Accreditation & Quality Assurance"):
+        st.markdown(f"""
     **Accreditation status:**
     - Accredited programs: {accredited_programs} / {total_programs}
 
@@ -778,11 +615,11 @@ with st.expander("🏅 Accreditation & Quality Assurance"):
     "Initiate accreditation readiness assessments"}
     """)
 
-# --------------------------------------------------
-# REGIONAL & GLOBAL INTEGRATION
-# --------------------------------------------------
-with st.expander("🌍 Regional & Global Integration"):
-    st.markdown(f"""
+    # --------------------------------------------------
+    # REGIONAL & GLOBAL INTEGRATION
+    # --------------------------------------------------
+    with st.expander("🌍 Regional & Global Integration"):
+        st.markdown(f"""
     **Networks represented:**
     {", ".join(network_membership) if network_score > 0 else "No formal regional network affiliation"}
 
@@ -790,19 +627,24 @@ with st.expander("🌍 Regional & Global Integration"):
     {"Well-integrated" if network_score >= 1 else "Limited integration — partnership support recommended"}
     """)
 
-# --------------------------------------------------
-# DONOR & PARTNER ENTRY POINTS
-# --------------------------------------------------
-with st.expander("💰 Donor & Partner Entry Points"):
-    st.markdown("""
+    # --------------------------------------------------
+    # DONOR & PARTNER ENTRY POINTS
+    # --------------------------------------------------
+    with st.expander("💰 Donor & Partner Entry Points"):
+        st.markdown("""
     **Priority investment levers derived from country metrics:**
     """)
 
-    if accredited_programs == 0:
-        st.markdown("- Accreditation readiness and external review support")
-    if len(modalities_present) < 3:
-        st.markdown("- Expansion of intermediate and advanced training modalities")
-    if years_active < 5:
-        st.markdown("- Institutional strengthening and faculty development")
-    if network_score == 0:
-        st.markdown("- Regional and global partnership integration")
+        if accredited_programs == 0:
+            st.markdown("- Accreditation readiness and external review support")
+        if len(modalities_present) < 3:
+            st.markdown("- Expansion of intermediate and advanced training modalities")
+        if years_active < 5:
+            st.markdown("- Institutional strengthening and faculty development")
+        if network_score == 0:
+            st.markdown("- Regional and global partnership integration")
+
+
+render_country_sections()
+
+end_trace()
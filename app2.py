@@ -3,7 +3,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import time
-from utils.data_loader import load_all_data
+from utils.repository import get_repository
+from utils.readiness import INVESTMENT_PRIORITIES, RECOMMENDATIONS, load_readiness_table
 
 
 
@@ -32,21 +33,12 @@ div[data-testid="stAlert"] p {
 </style>
 """, unsafe_allow_html=True)
 # ==================================================
-@st.cache_data
-def load_countries():
-    return pd.read_csv("data/countries.csv")
+# Shared, read-only tables (parsed once per process, see utils/repository.py)
+repo = get_repository()
 
-@st.cache_data
-def load_programs():
-    return pd.read_csv("data/programs.csv")
-
-@st.cache_data
-def load_metrics():
-    return pd.read_csv("data/global_metrics.csv")
-
-countries_df = load_countries()
-programs_df = load_programs()
-metrics_df = load_metrics()
+countries_df = repo["countries"]
+readiness_df = load_readiness_table(repo.version)
+metrics_df = repo["metrics"]
 #st.write("METRICS CSV COLUMNS 👉", metrics_df.columns.tolist())
 #st.stop()
 
@@ -302,13 +294,9 @@ def render_dashboard():
         f"## 🇳🇬 Country Overview: {st.session_state.selected_country}"
     )
 
-    country_programs = programs_df[
-        programs_df["country"] == st.session_state.selected_country
-        ]
-
     st.metric(
         "Active FETP Programs",
-        len(country_programs)
+        readiness_df.loc[st.session_state.selected_country, "num_programs"]
     )
 
 
@@ -370,110 +358,33 @@ All pages are synchronized using the **country selector on the left** to provide
 # ==================================================
 selected_country = st.session_state.selected_country
 
-country_programs = programs_df[programs_df["country"] == selected_country]
-country_meta = countries_df[countries_df["country"] == selected_country]
-
-# --------------------------------------------------
-# DERIVED METRICS
-# --------------------------------------------------
-num_programs = len(country_programs)
-num_accredited = (country_programs["accredited"] == "Yes").sum()
-modalities = country_programs["modality"].dropna().unique()
-
-current_year = datetime.now().year
-
-if not country_programs.empty:
-    years_active = current_year - country_programs["established"].min()
-else:
-    years_active = 0
-
-# ==================================================
-# COUNTRY-SPECIFIC GOVERNANCE & READINESS METRICS
-# (MUST BE DEFINED BEFORE FLOWCHART UI)
-# ==================================================
+# Every country is scored up front (utils/readiness.py); switching
+# country is a row lookup in that table.
+country_readiness = readiness_df.loc[selected_country]
 
-# Defensive check
-if country_programs.empty:
-    host_institutions = []
-    total_programs = 0
-    accredited_programs = 0
-    modalities_present = []
-    network_membership = []
-    years_active = 0
-else:
-    # Host institutions
-    host_institutions = (
-        country_programs["host_institution"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
-
-    # Program counts
-    total_programs = len(country_programs)
-    accredited_programs = (
-        country_programs["accredited"].str.lower() == "yes"
-    ).sum()
-
-    # Modalities
-    modalities_present = (
-        country_programs["modality"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
-
-    # Network participation
-    network_membership = (
-        country_programs["network"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
-
-    # Institutional maturity proxy
-    years_active = (
-        2025 - country_programs["established"].min()
-        if pd.notna(country_programs["established"].min())
-        else 0
-    )
+num_programs = country_readiness["num_programs"]
+num_accredited = country_readiness["num_accredited"]
+modalities = country_readiness["modalities"]
+years_active = country_readiness["years_active"]
 
+# Governance & readiness metrics (used by the flowchart UI below)
+host_institutions = country_readiness["host_institutions"]
+total_programs = num_programs
+accredited_programs = num_accredited
+modalities_present = modalities
+network_membership = country_readiness["networks"]
 
 # --------------------------------------------------
 # CREDENTIALING READINESS SCORE (0–100)
 # --------------------------------------------------
+maturity_score = country_readiness["maturity_score"]
+accreditation_score = country_readiness["accreditation_score"]
+modality_score = country_readiness["modality_score"]
+network_score = country_readiness["network_score"]
 
-# 1. Program maturity (max 30)
-maturity_score = min((years_active / 25) * 30, 30)
-
-# 2. Accreditation strength (max 30)
-accreditation_score = (
-    (num_accredited / num_programs) * 30 if num_programs > 0 else 0
-)
-
-# 3. Modality breadth (max 20)
-modality_score = min(len(modalities) / 3 * 20, 20)
-
-# 4. Network integration (max 20)
-network_score = (
-    20 if country_programs["tephinet_member"].eq("Yes").any() else 0
-)
-
-# Final score
-readiness_score = round(
-    maturity_score + accreditation_score + modality_score + network_score
-)
-
-# Color & label
-if readiness_score >= 75:
-    readiness_color = "🟢"
-    readiness_label = "High Readiness"
-elif readiness_score >= 50:
-    readiness_color = "🟠"
-    readiness_label = "Moderate Readiness"
-else:
-    readiness_color = "🔴"
-    readiness_label = "Emerging Readiness"
+readiness_score = country_readiness["readiness_score"]
+readiness_color = country_readiness["readiness_color"]
+readiness_label = country_readiness["readiness_label"]
 
 # ==================================================
 # SNAPSHOT UI
@@ -485,7 +396,7 @@ col1, col2, col3, col4 = st.columns(4)
 with col1:
     st.metric(
         label="WHO Region",
-        value=country_meta["who_region"].values[0]
+        value=country_readiness["who_region"]
     )
 
 with col2:
@@ -552,56 +463,7 @@ st.info(
 # ==================================================
 st.markdown("## 🛠 Country-Specific Readiness Recommendations")
 
-recommendations = []
-
-# Accreditation gap
-if num_programs > 0 and num_accredited == 0:
-    recommendations.append(
-        "🏅 **Expand accreditation**: No accredited programs detected. "
-        "Prioritize accreditation pathways with regional or global bodies."
-    )
-
-elif num_programs > num_accredited:
-    recommendations.append(
-        "🏅 **Scale accreditation coverage**: Some programs remain unaccredited. "
-        "Target these for phased accreditation."
-    )
-
-# Modality gap
-if len(modalities) == 1:
-    recommendations.append(
-        "🎓 **Introduce additional training modalities**: "
-        "Expand beyond a single modality (e.g., add Intermediate or Advanced levels)."
-    )
-
-elif len(modalities) == 2:
-    recommendations.append(
-        "🎓 **Complete modality ladder**: "
-        "Introduce the missing training tier to ensure workforce progression."
-    )
-
-# Program maturity
-if years_active < 5:
-    recommendations.append(
-        "🏛 **Strengthen program maturity**: "
-        "Programs are relatively new. Focus on governance structures, faculty development, "
-        "and curriculum standardization."
-    )
-
-# Network integration
-if network_score == 0:
-    recommendations.append(
-        "🌐 **Strengthen regional integration**: "
-        "Country programs are not currently linked to regional or global FETP networks "
-        "(e.g., TEPHINET)."
-    )
-
-# High readiness refinement
-if readiness_score >= 75:
-    recommendations.append(
-        "🚀 **Advance to regional leadership**: "
-        "Position the country as a regional training hub and mentorship center."
-    )
+recommendations = [RECOMMENDATIONS[code] for code in country_readiness["recommendations"]]
 
 # --------------------------------------------------
 # DISPLAY RECOMMENDATIONS
@@ -620,47 +482,9 @@ else:
 # ==================================================
 st.markdown("## 💰 Donor Investment Priorities")
 
-investment_priorities = []
-
-# Accreditation investment
-if num_accredited == 0:
-    investment_priorities.append(
-        "**Accreditation systems strengthening** — Support accreditation fees, "
-        "technical assistance, and quality assurance systems."
-    )
-
-elif num_accredited < num_programs:
-    investment_priorities.append(
-        "**Accreditation scale-up** — Fund phased accreditation of remaining programs."
-    )
-
-# Workforce pipeline
-if len(modalities) < 3:
-    investment_priorities.append(
-        "**Workforce pipeline expansion** — Invest in Intermediate and Advanced training "
-        "modalities to strengthen career progression."
-    )
-
-# Institutional maturity
-if years_active < 5:
-    investment_priorities.append(
-        "**Institutional capacity building** — Support faculty development, "
-        "program governance, and curriculum standardization."
-    )
-
-# Network & global integration
-if network_score == 0:
-    investment_priorities.append(
-        "**Regional & global integration** — Enable participation in networks "
-        "such as TEPHINET and GFEP initiatives."
-    )
-
-# High readiness countries
-if readiness_score >= 75:
-    investment_priorities.append(
-        "**Regional leadership & south–south cooperation** — Fund the country "
-        "to serve as a regional training hub and mentorship center."
-    )
+investment_priorities = [
+    INVESTMENT_PRIORITIES[code] for code in country_readiness["investment_priorities"]
+]
 
 # --------------------------------------------------
 # DISPLAY
@@ -674,27 +498,10 @@ else:
         "including digital epidemiology, research translation, and regional leadership."
     )
 
-    # ==================================================
-    # COUNTRY-SPECIFIC GOVERNANCE METRICS
-    # ==================================================
-
-    # Host institutions
-    host_institutions = country_programs["host_institution"].dropna().unique()
-
-    # Accreditation metrics
-    total_programs = len(country_programs)
-    accredited_programs = (country_programs["accredited"] == "Yes").sum()
-
-    # Modalities present
-    modalities_present = sorted(country_programs["modality"].dropna().unique())
-
-    # Network participation
-    network_membership = country_programs["network"].dropna().unique()
+    # Governance panel counts represented networks rather than TEPHINET membership here
+    modalities_present = sorted(modalities_present)
     network_score = len(network_membership)
 
-    # Institutional maturity proxy
-    years_active = 2025 - country_programs["established"].min() if total_programs > 0 else 0
-
 # ==================================================
 # GOVERNANCE & ACCREDITATION PATHWAY (COUNTRY-AWARE)
 # ==================================================
@@ -0,0 +1,53 @@
+"""
+Scaling of the batch credentialing CLI (utils/batch_credentialing.py)
+with the number of worker processes, on a synthetic registry.
+Input is the programs Arrow snapshot, as in a nightly run after the
+dashboard has loaded the data once.
+
+    python -m benchmarks.bench_batch_credentialing --programs 10000000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_dataset
+from utils.batch_credentialing import run_batch
+from utils.data_loader import load_table, table_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--programs", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--chunk-rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="fetp-batch-bench-"))
+    try:
+        data_dir = write_dataset(tmp / "data", args.programs)
+        snapshot_dir = data_dir / ".snapshots"
+        load_table("programs", data_dir, snapshot_dir)          # writes the snapshot
+        programs_path = table_snapshot("programs", data_dir, snapshot_dir)
+        modalities = load_table("modalities", data_dir, snapshot_dir)
+        rules_path = data_dir / "credentialing_rules.json"
+
+        print(f"{args.programs:,} programs, {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            run_batch(programs_path, modalities, tmp / "results.parquet", "bench", rules_path,
+                      workers=workers, chunk_rows=args.chunk_rows, progress=lambda message: None)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {args.programs / elapsed:>12,.0f} {baseline / elapsed:>8.2f}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
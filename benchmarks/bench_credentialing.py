@@ -0,0 +1,138 @@
+"""
+Checks the scalar evaluate_program_eligibility and evaluate_programs_batch
+(both modes) against reference_eligibility, a frozen hand-written copy of
+the shipped rules, then reports throughput of each. The
+synthetic programs are heavily duplicated on the rule inputs (a few
+dozen distinct (modality, accredited, host present) tuples), as the
+real registry is: "distinct" evaluates each tuple once, "rows" every row.
+
+    python -m benchmarks.bench_credentialing [n_rows ...]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_programs
+from utils.schema import apply_schema
+from utils.credentialing_logic import (
+    EVALUATION_MODES,
+    decode_outcomes,
+    evaluate_program_eligibility,
+    evaluate_programs_batch,
+)
+
+SCALAR_ROWS = 100_000
+
+
+def make_inputs(n_rows, seed=0):
+    """Synthetic programs exercising every rule, including the blocking ones."""
+    rng = np.random.default_rng(seed)
+    modalities = pd.read_csv("data/modalities.csv")
+    modalities = pd.concat([
+        modalities,
+        pd.DataFrame([{
+            "modality_id": "SHORT_COURSE",
+            "name": "Short course",
+            "duration_months": 1,
+            "field_based_percent": 40,
+            "description": "Classroom-only refresher",
+        }]),
+    ], ignore_index=True)
+
+    programs = make_programs(n_rows, seed=seed)
+    modality_pool = np.append(modalities["modality_id"].to_numpy(), "UNLISTED")
+    programs["modality"] = rng.choice(modality_pool, n_rows)
+    programs.loc[rng.random(n_rows) < 0.05, "host_institution"] = np.nan
+    programs.loc[rng.random(n_rows) < 0.02, "host_institution"] = "  "
+    programs.loc[rng.random(n_rows) < 0.03, "accredited"] = np.nan
+    return programs, modalities
+
+
+def reference_eligibility(program_row, modality_lookup):
+    """
+    The rules of data/credentialing_rules.json written out by hand, as
+    before they became data. Frozen on purpose: the compiled plan is
+    checked against it, so update it only together with the rules file.
+    """
+    modality = program_row["modality"]
+    accredited = program_row["accredited"]
+    host = program_row["host_institution"]
+
+    if modality not in modality_lookup:
+        return "Not Eligible", ["Unrecognized training modality"], ["Standardize modality classification"]
+    duration = modality_lookup[modality]["duration_months"]
+    field_pct = modality_lookup[modality]["field_based_percent"]
+
+    if field_pct < 60:
+        return "Not Eligible", ["Insufficient field-based training"], ["Increase supervised field deployment"]
+    if not isinstance(host, str) or host.strip() == "":
+        return "Not Eligible", ["No accountable host institution"], ["Establish institutional oversight"]
+
+    reasons, actions = [], []
+    if duration < 18:
+        reasons.append("Training duration below professional credentialing threshold")
+        actions.append("Upgrade to advanced-level training")
+    if field_pct < 70:
+        reasons.append("Field exposure below optimal threshold")
+        actions.append("Strengthen field mentorship structure")
+    if not (pd.notna(accredited) and accredited in (True, "Yes")):
+        reasons.append("Program not formally accredited")
+        actions.append("Pursue FETP/FELTP accreditation")
+    return ("Conditionally Eligible" if reasons else "Eligible"), reasons, actions
+
+
+def scalar_results(programs, modalities, evaluate=evaluate_program_eligibility):
+    modality_lookup = modalities.set_index("modality_id").to_dict("index")
+    results = programs.apply(evaluate, axis=1, args=(modality_lookup,))
+    return pd.DataFrame({
+        "status": results.str[0],
+        "reasons": results.str[1].str.join("; "),
+        "actions": results.str[2].str.join("; "),
+    })
+
+
+def _batch_results(programs, modalities, mode):
+    results = evaluate_programs_batch(programs, modalities, mode=mode)
+    return results.assign(
+        reasons=decode_outcomes(results["outcome_mask"], kind="reasons"),
+        actions=decode_outcomes(results["outcome_mask"], kind="actions"),
+    )
+
+
+def check_equivalence(n_rows=20_000):
+    raw, modalities = make_inputs(n_rows, seed=1)
+    for label, programs in [("raw", raw), ("typed", apply_schema(raw, "programs"))]:
+        expected = scalar_results(programs, modalities, evaluate=reference_eligibility)
+        candidates = {"scalar": scalar_results(programs, modalities)}
+        candidates.update({mode: _batch_results(programs, modalities, mode) for mode in EVALUATION_MODES})
+        for name, actual in candidates.items():
+            for col in ["status", "reasons", "actions"]:
+                mismatched = (actual[col].astype(object) != expected[col]).sum()
+                assert mismatched == 0, f"{label} {name} {col}: {mismatched} rows differ from the reference rules"
+    print(f"scalar, batch ({' / '.join(EVALUATION_MODES)}) == reference rules on {n_rows:,} raw and typed rows")
+
+
+def _rate(fn, n_rows):
+    start = time.perf_counter()
+    fn()
+    return n_rows / (time.perf_counter() - start)
+
+
+def main(scales=(10_000, 100_000, 1_000_000)):
+    check_equivalence()
+    print(f"{'rows':>10} {'scalar rows/s':>14} {'rows rows/s':>14} {'distinct rows/s':>16}")
+    for n_rows in scales:
+        programs, modalities = make_inputs(n_rows)
+        scalar = (
+            f"{_rate(lambda: scalar_results(programs, modalities), n_rows):>14,.0f}"
+            if n_rows <= SCALAR_ROWS else f"{'-':>14}"
+        )
+        rows = _rate(lambda: evaluate_programs_batch(programs, modalities, mode="rows"), n_rows)
+        distinct = _rate(lambda: evaluate_programs_batch(programs, modalities, mode="distinct"), n_rows)
+        print(f"{n_rows:>10,} {scalar} {rows:>14,.0f} {distinct:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (10_000, 100_000, 1_000_000))
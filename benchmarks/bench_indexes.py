@@ -0,0 +1,44 @@
+"""
+Filter latency: full-column boolean scan vs ColumnIndex lookup + take.
+A fixed-size key (100 rows) is planted at every scale, so index latency
+should stay flat while the scan grows with the table.
+
+    python -m benchmarks.bench_indexes
+"""
+import time
+
+from benchmarks.synthetic import make_programs
+from utils.indexes import build_program_indexes
+
+SCALES = [10_000, 100_000, 1_000_000]
+REPEATS = 20
+PLANTED_ROWS = 100
+
+
+def _per_call_ms(fn):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    print(f"{'rows':>10} {'scan (ms)':>10} {'index (ms)':>11} {'build (s)':>10}")
+    for n_rows in SCALES:
+        programs = make_programs(n_rows)
+        programs.loc[programs.index[::n_rows // PLANTED_ROWS], "network"] = "PLANTED_NET"
+
+        start = time.perf_counter()
+        indexes = build_program_indexes(programs)
+        build_s = time.perf_counter() - start
+
+        scanned = programs[programs["network"] == "PLANTED_NET"]
+        assert scanned.equals(indexes["network"].take(programs, "PLANTED_NET"))
+
+        scan_ms = _per_call_ms(lambda: programs[programs["network"] == "PLANTED_NET"])
+        index_ms = _per_call_ms(lambda: indexes["network"].take(programs, "PLANTED_NET"))
+        print(f"{n_rows:>10,} {scan_ms:>10.3f} {index_ms:>11.3f} {build_s:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
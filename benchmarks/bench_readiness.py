@@ -0,0 +1,61 @@
+"""
+Per-country-switch latency of the Credentialing Readiness Index:
+the old per-rerun boolean-mask recomputation vs a lookup in the
+precomputed readiness table.
+
+    python -m benchmarks.bench_readiness [n_rows]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_programs
+from utils.readiness import compute_readiness_table
+
+
+def recompute_for_country(programs_df, country):
+    # What Navigation.py did on every rerun before the readiness table
+    country_programs = programs_df[programs_df["country"] == country]
+    num_programs = len(country_programs)
+    num_accredited = (country_programs["accredited"] == "Yes").sum()
+    modalities = country_programs["modality"].dropna().unique()
+    years_active = 2025 - country_programs["established"].min() if num_programs else 0
+    host_institutions = country_programs["host_institution"].dropna().unique().tolist()
+    network_membership = country_programs["network"].dropna().unique().tolist()
+    maturity_score = min((years_active / 25) * 30, 30)
+    accreditation_score = (num_accredited / num_programs) * 30 if num_programs > 0 else 0
+    modality_score = min(len(modalities) / 3 * 20, 20)
+    network_score = 20 if country_programs["tephinet_member"].eq("Yes").any() else 0
+    return (
+        round(maturity_score + accreditation_score + modality_score + network_score),
+        host_institutions,
+        network_membership,
+    )
+
+
+def main(n_rows=1_000_000):
+    programs = make_programs(n_rows)
+    countries = pd.read_csv("data/countries.csv")
+    switches = countries["country"].tolist()
+
+    start = time.perf_counter()
+    expected = {country: recompute_for_country(programs, country)[0] for country in switches}
+    before_ms = (time.perf_counter() - start) / len(switches) * 1000
+
+    start = time.perf_counter()
+    table = compute_readiness_table(programs, countries)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = {country: table.loc[country, "readiness_score"] for country in switches}
+    after_ms = (time.perf_counter() - start) / len(switches) * 1000
+
+    assert actual == expected, "readiness table disagrees with per-country recomputation"
+    print(f"{n_rows:,} programs, {len(switches)} countries")
+    print(f"  recompute per switch: {before_ms:9.3f} ms")
+    print(f"  table lookup per switch: {after_ms:6.3f} ms (table built once in {build_s:.3f}s)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,33 @@
+"""
+Memory footprint of the programs table as parsed by pd.read_csv vs the
+typed frame produced by utils.schema.apply_schema.
+
+    python -m benchmarks.bench_schema_memory [n_rows]
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import make_programs
+from utils.schema import apply_schema, memory_report
+
+
+def main(n_rows=1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "programs.csv"
+        make_programs(n_rows).to_csv(csv_path, index=False)
+
+        raw = {
+            "programs (object)": pd.read_csv(csv_path, dtype=object),
+            "programs (read_csv default)": pd.read_csv(csv_path),
+        }
+        typed = {name: apply_schema(df, "programs") for name, df in raw.items()}
+
+    report = memory_report(raw, typed)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
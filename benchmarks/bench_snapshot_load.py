@@ -0,0 +1,43 @@
+"""
+Cold-start load time of programs.csv: plain CSV parsing vs the Arrow
+snapshot used by utils.data_loader.
+
+    python -m benchmarks.bench_snapshot_load
+"""
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import make_programs
+from utils.snapshots import read_table
+
+SCALES = [10_000, 100_000, 1_000_000]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'rows':>10} {'csv (s)':>10} {'build (s)':>10} {'snapshot (s)':>13} {'speedup':>8}")
+
+    for n_rows in SCALES:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "programs.csv"
+            snapshot_dir = Path(tmp) / ".snapshots"
+            make_programs(n_rows).to_csv(csv_path, index=False)
+
+            csv_s, expected = _timed(lambda: pd.read_csv(csv_path))
+            build_s, _ = _timed(lambda: read_table(csv_path, snapshot_dir))
+            snap_s, loaded = _timed(lambda: read_table(csv_path, snapshot_dir))
+
+            assert loaded.shape == expected.shape
+            print(f"{n_rows:>10,} {csv_s:>10.3f} {build_s:>10.3f} {snap_s:>13.3f} {csv_s / snap_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
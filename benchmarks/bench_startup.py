@@ -0,0 +1,82 @@
+"""
+Time to first render of the welcome gate on a freshly started server
+(cold process: nothing imported or parsed yet), and latency of the
+"Proceed" rerun after the user spends THINK_S on the role selector.
+Each trial starts its own `streamlit run Navigation.py` (see load_test).
+
+    python -m benchmarks.bench_startup --trials 3 --programs 100000
+"""
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import websockets
+
+from benchmarks.load_test import PROCEED_LABEL, ROLE_LABEL, Session, _free_port, start_server
+
+THINK_S = 3.0
+
+
+async def _first_visit(port, think_s):
+    session = Session(port, seed=0)
+    start = time.perf_counter()
+    async with websockets.connect(
+        session.url, subprotocols=["streamlit"], max_size=None, open_timeout=30,
+    ) as ws:
+        await session._rerun(ws)                                        # welcome gate
+        first_render = time.perf_counter() - start
+
+        await asyncio.sleep(think_s)
+        session._select(ROLE_LABEL)
+        await session._rerun(ws)                                        # role select
+        proceed = await session._rerun(ws, trigger=session.widgets[PROCEED_LABEL].id)
+    return first_render, proceed, session.errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--programs", type=int, default=None,
+                        help="Run against a synthetic dataset of this many programs.")
+    parser.add_argument("--think", type=float, default=THINK_S,
+                        help="Seconds spent on the role selector before Proceed.")
+    args = parser.parse_args()
+
+    tmp = None
+    data_dir = None
+    if args.programs:
+        from benchmarks.synthetic import write_dataset
+        tmp = tempfile.mkdtemp(prefix="fetp-startup-")
+        data_dir = write_dataset(Path(tmp), args.programs, seed=0)
+
+    rows = []
+    try:
+        for _ in range(args.trials):
+            port = _free_port()
+            start = time.perf_counter()
+            proc = start_server(port, data_dir)
+            healthy = time.perf_counter() - start
+            try:
+                first_render, proceed, errors = asyncio.run(_first_visit(port, args.think))
+            finally:
+                proc.terminate()
+                proc.wait(timeout=30)
+            rows.append((healthy, first_render, proceed, len(errors)))
+    finally:
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"dataset: {data_dir or 'data/'}   think time {args.think:.1f} s")
+    print(f"{'trial':>5} {'server up s':>12} {'first render ms':>16} {'proceed ms':>11} {'errors':>7}")
+    for i, (healthy, first_render, proceed, n_errors) in enumerate(rows, 1):
+        print(f"{i:>5} {healthy:>12.2f} {first_render * 1000:>16.0f} {proceed * 1000:>11.0f} {n_errors:>7}")
+    medians = np.median(np.array([row[:3] for row in rows]), axis=0)
+    print(f"{'p50':>5} {medians[0]:>12.2f} {medians[1] * 1000:>16.0f} {medians[2] * 1000:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
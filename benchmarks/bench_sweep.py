@@ -0,0 +1,50 @@
+"""
+Threshold sensitivity sweep: checks a few grid points against a full
+re-evaluation with the thresholds changed, then times a 50x50 grid.
+
+    python -m benchmarks.bench_sweep [n_rows]
+"""
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.bench_credentialing import make_inputs
+from utils.credentialing_logic import (
+    DURATION_RULE,
+    FIELD_RULE,
+    eligibility_sweep,
+    evaluate_programs_batch,
+)
+from utils.credentialing_rules import EvaluationPlan, get_plan
+
+
+def check_against_batch(programs, modalities):
+    plan = get_plan()
+    sweep = eligibility_sweep(programs, modalities, [12, 18, 24], [50, 60])
+    for duration in [12, 18, 24]:
+        for field in [50, 60]:
+            shifted = EvaluationPlan(plan.rule_set.with_values(**{DURATION_RULE: duration, FIELD_RULE: field}))
+            expected = (
+                evaluate_programs_batch(programs, modalities, shifted)
+                .groupby([programs["who_region"], "status"], observed=False).size()
+            )
+            actual = sweep.xs((duration, field), level=["duration_threshold", "field_threshold"])
+            assert (actual.sort_index() == expected.reindex(actual.index).fillna(0).sort_index()).all()
+    print("sweep == batch re-evaluation at 6 grid points")
+
+
+def main(n_rows=1_000_000):
+    programs, modalities = make_inputs(n_rows)
+    check_against_batch(programs.head(50_000), modalities)
+
+    durations = np.linspace(0, 36, 50)
+    fields = np.linspace(30, 90, 50)
+    start = time.perf_counter()
+    sweep = eligibility_sweep(programs, modalities, durations, fields)
+    elapsed = time.perf_counter() - start
+    print(f"50x50 grid over {n_rows:,} programs: {elapsed:.3f}s ({len(sweep):,} cells)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Table render preparation: whole filtered frame vs one page.
+"full" is what the pages sent to st.dataframe before (as_display over
+every row, then sorted); "paged" is utils.table_view (cached sort order,
+selection + slice of one 50-row page). Both include Arrow serialization,
+which is what st.dataframe does with the frame.
+
+    python -m benchmarks.bench_table_view
+"""
+import time
+
+import numpy as np
+import pyarrow as pa
+
+from benchmarks.synthetic import make_programs
+from utils.schema import apply_schema, as_display
+from utils.table_view import select_rows
+
+SCALES = [50, 5_000, 500_000]
+REPEATS = 5
+PAGE_SIZE = 50
+COLUMNS = ["program_name", "country", "modality", "discipline", "established", "accredited"]
+
+
+def _per_call_ms(fn):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    print(f"{'rows':>10} {'full (ms)':>10} {'paged (ms)':>11}")
+    for n_rows in SCALES:
+        programs = apply_schema(make_programs(n_rows), "programs")
+        positions = np.arange(n_rows)
+        cache_key = ("bench", n_rows)
+
+        def full():
+            shown = as_display(programs.take(positions))[COLUMNS].sort_values("established")
+            pa.Table.from_pandas(shown)
+
+        def paged():
+            rows = select_rows(programs, positions, COLUMNS, sort_by="established", cache_key=cache_key)
+            pa.Table.from_pandas(as_display(programs.take(rows[:PAGE_SIZE]))[COLUMNS])
+
+        paged()  # warm the shared sort order, as the first session would
+        print(f"{n_rows:>10,} {_per_call_ms(full):>10.2f} {_per_call_ms(paged):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
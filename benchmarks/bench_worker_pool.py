@@ -0,0 +1,97 @@
+"""
+How much one session's heavy computation stalls another session's rerun.
+A "heavy" thread (one session) recomputes the readiness table and the
+threshold sweep, either in its own thread (as before) or through
+utils.worker_pool; meanwhile a "light" thread (another session) keeps
+doing small, table-page-sized reruns. Reported: the light rerun latency
+while the heavy work runs, and the heavy work's own wall time.
+
+    python -m benchmarks.bench_worker_pool --programs 1000000
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+HEAVY_ROUNDS = 3
+LIGHT_PAGE = 50
+
+
+def _heavy(repo, in_pool):
+    from utils.credentialing_logic import eligibility_sweep
+    from utils.credentialing_rules import get_plan
+    from utils.readiness import READINESS_COLUMNS, compute_readiness_table
+    from utils.worker_pool import run_job
+
+    sweep_args = dict(duration_thresholds=np.arange(0, 37, 3),
+                      field_thresholds=np.arange(30, 95, 5), plan=get_plan())
+    for _ in range(HEAVY_ROUNDS):
+        if in_pool:
+            run_job(compute_readiness_table, repo, {"programs": READINESS_COLUMNS, "countries": None})
+            run_job(eligibility_sweep, repo,
+                    {"programs": ["who_region", "modality", "accredited", "host_institution"],
+                     "modalities": None}, **sweep_args)
+        else:
+            compute_readiness_table(repo["programs"], repo["countries"])
+            eligibility_sweep(repo["programs"], repo["modalities"], **sweep_args)
+
+
+def _light_rerun(repo, rng):
+    from utils.schema import as_display
+
+    programs = repo["programs"]
+    rows = rng.integers(0, len(programs), LIGHT_PAGE)
+    as_display(programs.take(rows))
+
+
+def measure(repo, in_pool):
+    rng = np.random.default_rng(0)
+    latencies = []
+    heavy = threading.Thread(target=_heavy, args=(repo, in_pool))
+    start = time.perf_counter()
+    heavy.start()
+    while heavy.is_alive():
+        t = time.perf_counter()
+        _light_rerun(repo, rng)
+        latencies.append(time.perf_counter() - t)
+    heavy.join()
+    return np.array(latencies) * 1000, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--programs", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="fetp-pool-")
+    try:
+        from benchmarks.synthetic import write_dataset
+        data_dir = write_dataset(Path(tmp), args.programs, seed=0)
+        os.environ["FETP_DATA_DIR"] = str(data_dir)
+        os.environ["FETP_SNAPSHOT_DIR"] = str(Path(data_dir) / ".snapshots")
+
+        # Imported after the environment points at the synthetic dataset
+        from utils.repository import get_repository
+        from utils.worker_pool import get_pool, pool_size
+
+        repo = get_repository()
+        get_pool()
+        _heavy(repo, in_pool=True)   # start the workers, read the snapshots once
+
+        print(f"{args.programs:,} programs, {os.cpu_count()} CPU(s), {pool_size()} pool worker(s)")
+        print(f"{'heavy job':>12} {'light p50 ms':>13} {'p95 ms':>8} {'max ms':>8} {'heavy s':>8}")
+        for label, in_pool in [("in-thread", False), ("worker pool", True)]:
+            latencies, heavy_s = measure(repo, in_pool)
+            print(f"{label:>12} {np.percentile(latencies, 50):>13.1f} "
+                  f"{np.percentile(latencies, 95):>8.1f} {latencies.max():>8.1f} {heavy_s:>8.2f}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Checks that pages share one parsed copy of the data:
+  1. every page (and the landing page) compiles and renders, and after the
+     repository is warm none parses a CSV or snapshot again on first run
+     or rerun;
+  2. process RSS stays flat as simulated sessions grow from 1 to 200
+     (at most MAX_MB_PER_SESSION per added session);
+  3. a figure from the shared figure cache is each caller's own: editing
+     it, or building it from many threads at once, leaves the cached one
+     intact.
+
+    python -m benchmarks.check_shared_repository [n_programs]
+
+This is the CI check for the shared repository (the repo has no pytest
+suite): run it from the repository root in any job that touches utils/
+or pages/, e.g. `python -m benchmarks.check_shared_repository 100000`.
+It exits 1 with the failed check's message, 0 when all pass.
+
+With n_programs, runs against a copy of data/ whose programs table is
+replaced by that many synthetic rows. Worker-pool jobs run in-process
+here (FETP_WORKER_POOL=0) so their reads are counted too, and every
+session is an admin (FETP_ADMINS=*) so the diagnostics page runs fully.
+"""
+import glob
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+SESSION_COUNTS = [1, 50, 200]
+FIGURE_THREADS = 8
+FIGURE_CALLS_PER_THREAD = 50
+# Session state only; a per-session copy of the data would be far larger
+MAX_MB_PER_SESSION = 1.0
+
+
+def _rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 if sys.platform != "darwin" else 1024 * 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 / scale / 1024
+
+
+def _session(script):
+    at = AppTest.from_file(str(ROOT / script), default_timeout=60)
+    at.session_state["entered"] = True
+    at.session_state["role"] = "National Secretariat / Analyst"
+    return at
+
+
+def check_no_reparse():
+    from utils.repository import get_repository
+
+    get_repository()
+    scripts = ["Navigation.py"] + sorted(
+        str(Path(p).relative_to(ROOT)) for p in glob.glob(str(ROOT / "pages" / "*.py"))
+    )
+    with mock.patch.object(pd, "read_csv", wraps=pd.read_csv) as read_csv, \
+            mock.patch.object(pd, "read_feather", wraps=pd.read_feather) as read_feather:
+        for script in scripts:
+            # AppTest only logs a script that does not compile, then renders nothing
+            try:
+                compile((ROOT / script).read_text(encoding="utf-8"), script, "exec")
+            except SyntaxError as exc:
+                raise AssertionError(f"{script} does not compile: {exc}") from exc
+            at = _session(script).run()
+            at.run()
+            assert not at.exception, f"{script}: {at.exception}"
+            assert at.main.children, f"{script} rendered nothing"
+            parses = read_csv.call_count + read_feather.call_count
+            assert parses == 0, f"{script} parsed data {parses} times"
+    print(f"no re-parse across {len(scripts)} scripts (first run + rerun)")
+
+
+def check_memory_flat():
+    sessions = []
+    rss = {}
+    for target in SESSION_COUNTS:
+        while len(sessions) < target:
+            sessions.append(_session("Navigation.py").run())
+        rss[target] = _rss_mb()
+        print(f"{target:>4} sessions: peak RSS {rss[target]:8.1f} MB")
+    first, last = SESSION_COUNTS[0], SESSION_COUNTS[-1]
+    per_session = (rss[last] - rss[first]) / (last - first)
+    assert per_session <= MAX_MB_PER_SESSION, (
+        f"RSS grows {per_session:.2f} MB per session (budget {MAX_MB_PER_SESSION} MB)"
+    )
+
+
+def check_figure_isolation():
+    import plotly.graph_objects as go
+
+    from utils.figures import cached_figure
+
+    def build():
+        return go.Figure(go.Scattergeo(lat=[0, 1], lon=[0, 1], name="programs"))
+
+    def get():
+        return cached_figure(build, "check_shared_repository")
+
+    expected = get().to_dict()
+    fig = get()
+    fig.update_layout(title_text="edited")
+    fig.add_trace(go.Scattergeo(lat=[2], lon=[2]))
+    assert get().to_dict() == expected, "editing a cached figure changed the cache entry"
+
+    failures = []
+
+    def session():
+        for _ in range(FIGURE_CALLS_PER_THREAD):
+            try:
+                if get().to_dict() != expected:
+                    failures.append("figure differs from the cached one")
+            except Exception as exc:  # noqa: BLE001 - report every kind of failure
+                failures.append(f"{type(exc).__name__}: {str(exc).splitlines()[0]}")
+
+    threads = [threading.Thread(target=session) for _ in range(FIGURE_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls = FIGURE_THREADS * FIGURE_CALLS_PER_THREAD
+    assert not failures, f"{len(failures)} of {calls} concurrent figure calls failed: {failures[0]}"
+    print(f"cached figures isolated (edits, {calls} calls from {FIGURE_THREADS} threads)")
+
+
+def main(n_programs=None):
+    sys.path.insert(0, str(ROOT))
+    os.chdir(ROOT)
+    os.environ["FETP_WORKER_POOL"] = "0"
+    os.environ["FETP_ADMINS"] = "*"
+    with tempfile.TemporaryDirectory() as tmp:
+        if n_programs:
+            from benchmarks.synthetic import make_programs
+
+            data_dir = Path(tmp) / "data"
+            shutil.copytree(ROOT / "data", data_dir, ignore=shutil.ignore_patterns(".snapshots"))
+            make_programs(n_programs).to_csv(data_dir / "programs.csv", index=False)
+            # Must be set before utils.* is first imported
+            os.environ["FETP_DATA_DIR"] = str(data_dir)
+
+        try:
+            check_no_reparse()
+            check_memory_flat()
+            check_figure_isolation()
+        except AssertionError as exc:
+            print(f"FAILED: {exc}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
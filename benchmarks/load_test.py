@@ -0,0 +1,265 @@
+"""
+Headless load test: N concurrent simulated sessions walk the real flow
+(welcome gate -> role select -> Proceed -> country switches -> page
+visits) against a local `streamlit run Navigation.py` server, speaking
+the same websocket protocol as the browser frontend. Fully offline.
+Reports rerun latency percentiles, throughput and server RSS per N, and
+the latency of country switches alone (a fragment rerun when the
+selector lives in an st.fragment).
+
+    python -m benchmarks.load_test --sessions 1 10 50 --programs 100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = Path(__file__).resolve().parent.parent
+ROLE_LABEL = "This tailors the intelligence briefing to your mandate"
+PROCEED_LABEL = "Proceed to Intelligence Briefing"
+COUNTRY_LABEL = "Select Country"
+COUNTRY_SWITCHES = 3
+STARTUP_TIMEOUT_S = 120
+RERUN_TIMEOUT_S = 300
+
+
+# ==================================================
+# SERVER
+# ==================================================
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / 2**20
+    except Exception:
+        return float("nan")
+
+
+def start_server(port, data_dir=None):
+    env = dict(os.environ)
+    if data_dir:
+        env["FETP_DATA_DIR"] = str(data_dir)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "Navigation.py",
+         "--server.headless", "true",
+         "--server.address", "127.0.0.1",
+         "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("streamlit server exited during startup")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError("streamlit server did not become healthy")
+
+
+# ==================================================
+# SIMULATED SESSION
+# ==================================================
+class Session:
+    """One simulated browser tab; records the latency of every rerun."""
+
+    def __init__(self, port, seed):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.rng = random.Random(seed)
+        self.latencies = []
+        self.switch_latencies = []
+        self.errors = []
+        self.widgets = {}       # label -> element proto (selectbox/button)
+        self.fragments = {}     # label -> id of the fragment holding the widget
+        self.values = {}        # widget id -> selected string value
+        self.pages = []         # (page_script_hash, page_name) of non-default pages
+        self.page_hash = ""
+
+    async def _rerun(self, ws, page_hash=None, trigger=None, fragment_id=""):
+        if page_hash is not None:
+            self.page_hash = page_hash
+            self.widgets.clear()
+            self.fragments.clear()
+            self.values.clear()
+
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.page_script_hash = self.page_hash
+        state.fragment_id = fragment_id
+        for widget_id, value in self.values.items():
+            state.widget_states.widgets.append(WidgetState(id=widget_id, string_value=value))
+        if trigger is not None:
+            state.widget_states.widgets.append(WidgetState(id=trigger, trigger_value=True))
+
+        start = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        await self._drain(ws)
+        elapsed = time.perf_counter() - start
+        self.latencies.append(elapsed)
+        return elapsed
+
+    async def _drain(self, ws):
+        """Consume forward messages until the script run (and any st.rerun) ends."""
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await asyncio.wait_for(ws.recv(), RERUN_TIMEOUT_S))
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.pages = [
+                    (p.page_script_hash, p.page_name)
+                    for p in fwd.new_session.app_pages if not p.is_default
+                ]
+                self.page_hash = fwd.new_session.page_script_hash
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                field = element.WhichOneof("type")
+                if field in ("selectbox", "button"):
+                    widget = getattr(element, field)
+                    self.widgets[widget.label] = widget
+                    self.fragments[widget.label] = fwd.delta.fragment_id
+                elif field == "exception":
+                    self.errors.append(element.exception.message)
+            elif kind == "script_finished":
+                status = fwd.script_finished
+                if status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    self.errors.append("compile error")
+                if status != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return
+
+    def _select(self, label, value=None):
+        widget = self.widgets[label]
+        value = value if value is not None else self.rng.choice(list(widget.options))
+        self.values[widget.id] = value
+        return widget
+
+    async def walk(self):
+        async with websockets.connect(
+            self.url, subprotocols=["streamlit"], max_size=None, open_timeout=30,
+        ) as ws:
+            await self._rerun(ws)                                      # welcome gate
+
+            self._select(ROLE_LABEL)
+            await self._rerun(ws)                                      # role select
+            await self._rerun(ws, trigger=self.widgets[PROCEED_LABEL].id)  # Proceed
+
+            countries = list(self.widgets[COUNTRY_LABEL].options)
+            for country in self.rng.sample(countries, COUNTRY_SWITCHES):
+                self._select(COUNTRY_LABEL, country)
+                elapsed = await self._rerun(
+                    ws, fragment_id=self.fragments[COUNTRY_LABEL]      # country switch
+                )
+                self.switch_latencies.append(elapsed)
+
+            for page_hash, _ in list(self.pages):                      # page visits
+                await self._rerun(ws, page_hash=page_hash)
+
+
+# ==================================================
+# DRIVER
+# ==================================================
+async def _run_sessions(port, n_sessions):
+    sessions = [Session(port, seed) for seed in range(n_sessions)]
+    results = await asyncio.gather(*(s.walk() for s in sessions), return_exceptions=True)
+    for session, result in zip(sessions, results):
+        if isinstance(result, BaseException):
+            session.errors.append(f"{type(result).__name__}: {result}")
+    return sessions
+
+
+async def _sample_rss(pid, samples, stop):
+    while not stop.is_set():
+        samples.append(_rss_mb(pid))
+        try:
+            await asyncio.wait_for(stop.wait(), 0.2)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _run_level(proc, port, n_sessions):
+    samples, stop = [_rss_mb(proc.pid)], asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(proc.pid, samples, stop))
+    start = time.perf_counter()
+    sessions = await _run_sessions(port, n_sessions)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await sampler
+    return sessions, elapsed, samples
+
+
+def run_level(proc, port, n_sessions):
+    sessions, elapsed, rss = asyncio.run(_run_level(proc, port, n_sessions))
+    latencies = np.array([t for s in sessions for t in s.latencies]) * 1000
+    switches = np.array([t for s in sessions for t in s.switch_latencies]) * 1000
+    errors = [e for s in sessions for e in s.errors]
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+    switch_p50 = np.percentile(switches, 50) if len(switches) else np.nan
+    print(f"{n_sessions:>8} {len(latencies):>7} {p50:>9.0f} {p95:>9.0f} {p99:>9.0f} "
+          f"{switch_p50:>10.0f} {len(latencies) / elapsed:>9.1f} {max(rss):>12.0f} {len(errors):>7}")
+    for error in sorted(set(errors))[:5]:
+        print(f"         ! {error[:120]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--programs", type=int, default=None,
+                        help="Run against a synthetic dataset of this many programs.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tmp = None
+    data_dir = None
+    if args.programs:
+        from benchmarks.synthetic import write_dataset
+        tmp = tempfile.mkdtemp(prefix="fetp-load-")
+        data_dir = write_dataset(Path(tmp), args.programs, seed=args.seed)
+
+    port = _free_port()
+    proc = start_server(port, data_dir)
+    try:
+        asyncio.run(_run_sessions(port, 1))                      # warm caches
+        print(f"dataset: {data_dir or 'data/'}   server pid {proc.pid}   "
+              f"idle RSS {_rss_mb(proc.pid):.0f} MB")
+        print(f"{'sessions':>8} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+              f"{'switch ms':>10} {'reruns/s':>9} {'peak RSS MB':>12} {'errors':>7}")
+        for n_sessions in args.sessions:
+            run_level(proc, port, n_sessions)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Scaling benchmark suite. For each scale, generates a synthetic dataset
+(benchmarks/synthetic.py) and runs each page's computation headlessly,
+reporting wall time and peak traced memory per stage.
+
+    python -m benchmarks.run_suite                      # 1k .. 1M programs
+    python -m benchmarks.run_suite --scales 1000 10000000 --json out.json
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.synthetic import write_dataset
+from utils.credentialing_logic import evaluate_programs_batch
+from utils.data_loader import data_version
+from utils.maps import africa_base_map, africa_program_points, selection_overlay
+from utils.readiness import compute_readiness_table
+from utils.repository import build_repository
+
+DEFAULT_SCALES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def _measure(fn):
+    # Timed and traced separately: tracemalloc slows allocation-heavy code
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def _stages(data_dir):
+    snapshot_dir = Path(data_dir) / ".snapshots"
+    version = data_version(data_dir)
+    repo = build_repository(version, data_dir, snapshot_dir)
+    programs = repo["programs"]
+    region = programs["who_region"].iloc[0]
+
+    points = africa_program_points(programs, repo["countries"])
+    base_map = africa_base_map(points)
+    country = points["country"].iloc[0]
+
+    def table_filtering():
+        indexes = repo.program_indexes
+        for column in ["country", "network", "modality", "who_region"]:
+            key = indexes[column].keys()[0]
+            indexes[column].take(programs, key)
+
+    return {
+        # A fresh snapshot directory per call forces CSV parsing + snapshot writes
+        "data load (cold)": lambda: build_repository(version, data_dir, tempfile.mkdtemp(dir=data_dir)),
+        "data load (snapshot)": lambda: build_repository(version, data_dir, snapshot_dir),
+        "readiness score": lambda: compute_readiness_table(programs, repo["countries"]),
+        "eligibility": lambda: evaluate_programs_batch(programs, repo["modalities"]),
+        "map dataframe prep": lambda: africa_program_points(programs, repo["countries"]),
+        "africa base map": lambda: africa_base_map(points),
+        "map selection overlay": lambda: selection_overlay(base_map, points, country),
+        "table filtering": table_filtering,
+        "region filter (scan)": lambda: programs[programs["who_region"] == region],
+    }
+
+
+def run(scales):
+    results = []
+    for n_programs in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = write_dataset(Path(tmp) / "data", n_programs)
+            for stage, fn in _stages(data_dir).items():
+                seconds, peak_mb = _measure(fn)
+                results.append({"programs": n_programs, "stage": stage, "seconds": seconds, "peak_mb": peak_mb})
+                print(f"{n_programs:>11,}  {stage:<22} {seconds:9.4f}s {peak_mb:10.1f} MB")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FETP dashboard scaling benchmarks")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    print(f"{'programs':>11}  {'stage':<22} {'time':>10} {'peak mem':>13}")
+    results = run(args.scales)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Synthetic FETP datasets at configurable scale.
+
+Writes every table load_all_data() expects, with referential integrity:
+programs reference generated countries (and their WHO region), host
+institutions located in the same country, network ids and modality ids.
+
+    python -m benchmarks.synthetic --programs 1000000 --out /tmp/fetp-1m
+"""
+import argparse
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_DIR = "data"
+
+# Tables copied verbatim from the sample data
+STATIC_FILES = ["partners.csv", "governance_models.csv", "global_metrics.csv", "credentialing_rules.json"]
+
+WHO_REGIONS = ["AFRO", "AMRO", "EMRO", "EURO", "SEARO", "WPRO"]
+
+# Rough bounding boxes (lat_min, lat_max, lon_min, lon_max) per region
+REGION_BOXES = {
+    "AFRO": (-34, 15, -17, 50),
+    "AMRO": (-40, 50, -120, -35),
+    "EMRO": (12, 37, 25, 70),
+    "EURO": (36, 62, -10, 40),
+    "SEARO": (5, 30, 68, 100),
+    "WPRO": (-40, 45, 100, 150),
+}
+
+PROGRAMS_PER_COUNTRY = 5_000
+INSTITUTIONS_PER_COUNTRY = 4
+DISCIPLINES = ["Epi", "Epi+Lab", "One Health", "Veterinary"]
+
+
+def _countries(n_countries, rng, sample):
+    extra = n_countries - len(sample)
+    if extra <= 0:
+        return sample.head(n_countries).reset_index(drop=True)
+
+    codes = np.char.add("X", np.char.zfill(np.arange(extra).astype(str), 4))
+    regions = rng.choice(WHO_REGIONS, extra)
+    boxes = np.array([REGION_BOXES[r] for r in regions])
+    generated = pd.DataFrame({
+        "country_code": codes,
+        "country": np.char.add("Country ", codes),
+        "who_region": regions,
+        "iso3": codes,
+        "lat": rng.uniform(boxes[:, 0], boxes[:, 1]).round(4),
+        "lon": rng.uniform(boxes[:, 2], boxes[:, 3]).round(4),
+    })
+    return pd.concat([sample, generated], ignore_index=True)
+
+
+def _institutions(countries, rng):
+    n_per = INSTITUTIONS_PER_COUNTRY
+    country = np.repeat(countries["country"].to_numpy(), n_per)
+    code = np.repeat(countries["country_code"].to_numpy(), n_per)
+    kind = np.tile(["Government", "University", "University", "Agency"], len(countries))
+    prefix = np.tile(["MOH", "UNI1", "UNI2", "NPHI"], len(countries))
+    return pd.DataFrame({
+        "institution_id": np.char.add(np.char.add(prefix.astype(str), "_"), code.astype(str)),
+        "name": np.char.add(np.char.add(kind.astype(str), " institution, "), country.astype(str)),
+        "type": kind,
+        "country": country,
+    })
+
+
+def _networks(countries, rng, sample):
+    regional = pd.DataFrame({
+        "network_id": [f"NET_{region}" for region in WHO_REGIONS],
+        "name": [f"{region} Field Epidemiology Network" for region in WHO_REGIONS],
+        "level": "Regional",
+        "established": rng.integers(1980, 2015, len(WHO_REGIONS)),
+        "headquarters": [
+            countries.loc[countries["who_region"] == region, "country"].iloc[0]
+            if (countries["who_region"] == region).any() else "Geneva"
+            for region in WHO_REGIONS
+        ],
+        "description": "Synthetic regional network",
+        "latitude": [np.mean(REGION_BOXES[r][:2]) for r in WHO_REGIONS],
+        "longitude": [np.mean(REGION_BOXES[r][2:]) for r in WHO_REGIONS],
+    })
+    return pd.concat([sample, regional], ignore_index=True)
+
+
+def generate_tables(n_programs, seed=0, sample_dir=SAMPLE_DIR):
+    rng = np.random.default_rng(seed)
+    sample_countries = pd.read_csv(f"{sample_dir}/countries.csv")
+    modalities = pd.read_csv(f"{sample_dir}/modalities.csv")
+
+    n_countries = max(len(sample_countries), n_programs // PROGRAMS_PER_COUNTRY)
+    countries = _countries(n_countries, rng, sample_countries)
+    institutions = _institutions(countries, rng)
+    networks = _networks(countries, rng, pd.read_csv(f"{sample_dir}/networks.csv"))
+
+    country_pos = rng.integers(0, len(countries), n_programs)
+    region = countries["who_region"].to_numpy()[country_pos]
+    ids = np.char.add("PRG_", np.arange(n_programs).astype(str))
+
+    # Host institution from the program's own country
+    host_pos = country_pos * INSTITUTIONS_PER_COUNTRY + rng.integers(0, INSTITUTIONS_PER_COUNTRY, n_programs)
+    host = institutions["institution_id"].to_numpy()[host_pos].astype(object)
+    host[rng.random(n_programs) < 0.01] = None
+
+    # Mostly the region's own network, sometimes a global one
+    network = np.char.add("NET_", region.astype(str)).astype(object)
+    global_ids = networks.loc[networks["level"] == "Global", "network_id"].to_numpy()
+    go_global = rng.random(n_programs) < 0.2
+    network[go_global] = rng.choice(global_ids, go_global.sum())
+
+    programs = pd.DataFrame({
+        "program_id": ids,
+        "program_name": np.char.add(
+            np.char.add(countries["country"].to_numpy()[country_pos].astype(str), " Field Epidemiology Program "),
+            ids,
+        ),
+        "country": countries["country"].to_numpy()[country_pos],
+        "who_region": region,
+        "network": network,
+        "modality": rng.choice(modalities["modality_id"].to_numpy(), n_programs),
+        "discipline": rng.choice(DISCIPLINES, n_programs),
+        "established": rng.integers(1951, 2025, n_programs),
+        "host_institution": host,
+        "tephinet_member": rng.choice(["Yes", "No"], n_programs, p=[0.85, 0.15]),
+        "accredited": rng.choice(["Yes", "No"], n_programs, p=[0.7, 0.3]),
+    })
+
+    return {
+        "programs": programs,
+        "countries": countries,
+        "institutions": institutions,
+        "networks": networks,
+        "modalities": modalities,
+    }
+
+
+def make_programs(n_rows, seed=0, sample_dir=SAMPLE_DIR):
+    return generate_tables(n_rows, seed, sample_dir)["programs"]
+
+
+def write_dataset(out_dir, n_programs, seed=0, sample_dir=SAMPLE_DIR):
+    """Writes a complete data/ directory the dashboard can run against."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, df in generate_tables(n_programs, seed, sample_dir).items():
+        df.to_csv(out_dir / f"{name}.csv", index=False)
+    for filename in STATIC_FILES:
+        shutil.copy(Path(sample_dir) / filename, out_dir / filename)
+    return out_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--programs", type=int, default=100_000)
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    out_dir = write_dataset(args.out, args.programs, args.seed)
+    print(f"wrote {args.programs:,} programs to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,27 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from utils.figures import cached_figure
+from utils.geo_clustering import clustered_map, map_detail_control
+from utils.repository import get_repository
+from utils.tracing import end_trace, section, start_trace
+
+start_trace("1_Global_Overview")
+
 if not st.session_state.get("entered", False):
     st.warning("Please return to the home page and click Proceed.")
+    end_trace()
     st.stop()
 
 
+section("header")
 st.title("🌐 Global Overview")
 
 # Load data
-metrics = pd.read_csv("data/global_metrics.csv")
-networks = pd.read_csv("data/networks.csv")
+section("load data")
+repo = get_repository()
+metrics = repo["metrics"]
+networks = repo["networks"]
 st.write("NETWORKS DATA PREVIEW")
 st.write(networks.head())
 
@@ -19,6 +30,7 @@ st.write(networks.head())
 #st.write(networks.columns)
 
 # ---- Metrics ----
+section("metrics")
 st.subheader("📊 Global FETP Metrics")
 
 cols = st.columns(3)
@@ -26,24 +38,44 @@ for i, row in metrics.iterrows():
     cols[i % 3].metric(row["metric"], row["value"])
 
 # ---- Network Map ----
+section("network map figure")
 st.subheader("🗺️ Global & Regional Network Headquarters")
 
-fig = px.scatter_geo(
-    networks,
-    lat="latitude",
-    lon="longitude",
-    hover_name="name",
-    hover_data=["level", "established", "headquarters"],
-    color="level",
-    projection="natural earth",
-    height=600
-)
+cell_degrees = map_detail_control(len(networks), default="World")
 
-fig.update_layout(
-    margin={"r":0,"t":0,"l":0,"b":0}
-)
 
-st.plotly_chart(fig, use_container_width=True)
+def build_network_map():
+    if cell_degrees is not None:
+        return clustered_map(
+            networks, cell_degrees, "Networks", label="level", noun="networks",
+            lat="latitude", lon="longitude", projection_type="natural earth", height=600
+        )
 
+    fig = px.scatter_geo(
+        networks,
+        lat="latitude",
+        lon="longitude",
+        hover_name="name",
+        hover_data=["level", "established", "headquarters"],
+        color="level",
+        projection="natural earth",
+        height=600
+    )
 
+    fig.update_layout(
+        margin={"r":0,"t":0,"l":0,"b":0}
+    )
+    return fig
+
+
+fig = cached_figure(
+    build_network_map,
+    "1_Global_Overview",
+    filters=(cell_degrees,),
+    data_version=repo.version
+)
+
+section("network map send")
+st.plotly_chart(fig, use_container_width=True)
 
+end_trace()
@@ -2,8 +2,17 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from utils.figures import cached_figure
+from utils.geo_clustering import clustered_map, map_detail_control
+from utils.repository import get_repository
+from utils.table_view import table_view
+from utils.tracing import end_trace, section, start_trace
+
+start_trace("2_Regional_Networks")
+
 st.set_page_config(layout="wide")
 
+section("header")
 st.title("🌐 Regional & Global FETP Networks")
 st.markdown(
     """
@@ -15,12 +24,16 @@ st.markdown(
 # -----------------------------
 # Load data
 # -----------------------------
-networks = pd.read_csv("data/networks.csv")
-programs = pd.read_csv("data/programs.csv")
+section("load data")
+repo = get_repository()
+networks = repo["networks"]
+programs = repo["programs"]
+program_indexes = repo.program_indexes
 
 # -----------------------------
 # Sidebar filter
 # -----------------------------
+section("sidebar filter")
 st.sidebar.header("Filter Networks")
 
 network_options = ["All Networks"] + sorted(networks["name"].unique().tolist())
@@ -29,6 +42,7 @@ selected_network = st.sidebar.selectbox("Select Network", network_options)
 # -----------------------------
 # Filter data
 # -----------------------------
+section("filter data")
 map_df = networks.copy()
 
 if selected_network != "All Networks":
@@ -37,33 +51,52 @@ if selected_network != "All Networks":
 # -----------------------------
 # Map: Network HQs
 # -----------------------------
-fig = px.scatter_geo(
-    map_df,
-    lat="latitude",
-    lon="longitude",
-    hover_name="name",
-    hover_data={
-        "level": True,
-        "established": True,
-        "headquarters": True,
-        "description": True,
-    },
-    projection="natural earth",
-    height=600
-)
+cell_degrees = map_detail_control(len(map_df), default="World")
 
-fig.update_layout(
-    margin=dict(r=0, t=0, l=0, b=0)
-)
 
+def build_network_map():
+    if cell_degrees is not None:
+        return clustered_map(
+            map_df, cell_degrees, "Networks", label="name", noun="networks",
+            lat="latitude", lon="longitude", projection_type="natural earth", height=600
+        )
 
+    fig = px.scatter_geo(
+        map_df,
+        lat="latitude",
+        lon="longitude",
+        hover_name="name",
+        hover_data={
+            "level": True,
+            "established": True,
+            "headquarters": True,
+            "description": True,
+        },
+        projection="natural earth",
+        height=600
+    )
+
+    fig.update_layout(
+        margin=dict(r=0, t=0, l=0, b=0)
+    )
+    return fig
 
 
+section("network map figure")
+fig = cached_figure(
+    build_network_map,
+    "2_Regional_Networks",
+    filters=(selected_network, cell_degrees),
+    data_version=repo.version
+)
+
+section("network map send")
 st.plotly_chart(fig, use_container_width=True)
 
 # -----------------------------
 # Network details
 # -----------------------------
+section("network details")
 if selected_network != "All Networks":
     st.subheader(f"📍 {selected_network} — Network Overview")
 
@@ -78,22 +111,24 @@ if selected_network != "All Networks":
 
     st.markdown("### 🌍 Supported National Programs")
 
-    supported_programs = programs[programs["network"] == selected_network]
+    supported_positions = program_indexes["network"].positions(selected_network)
 
-    if supported_programs.empty:
+    if len(supported_positions) == 0:
         st.info("No linked national programs found.")
     else:
-        st.dataframe(
-            supported_programs[
-                [
-                    "program_name",
-                    "country",
-                    "modality",
-                    "discipline",
-                    "established",
-                    "accredited"
-                ]
+        table_view(
+            programs,
+            [
+                "program_name",
+                "country",
+                "modality",
+                "discipline",
+                "established",
+                "accredited"
             ],
+            key="network_programs",
+            positions=supported_positions,
+            cache_key=("programs", repo.version),
             use_container_width=True
         )
 
@@ -113,3 +148,5 @@ if selected_network != "All Networks":
         - Joint accreditation and fellowship pipelines  
         """
     )
+
+end_trace()
@@ -1,9 +1,18 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+
+from utils.figures import cached_figure
+from utils.geo_clustering import map_detail_control
+from utils.maps import africa_base_map, africa_program_points, selection_overlay
+from utils.repository import get_repository
+from utils.schema import as_display
+from utils.tracing import end_trace, section, start_trace
+
+start_trace("3_National_Programs")
 
 st.set_page_config(layout="wide")
 
+section("header")
 st.title("🌍 National Field Epidemiology Training Programs (Africa)")
 
 st.markdown("""
@@ -18,69 +27,48 @@ Click on a country or select from the dropdown to explore:
 # -----------------------------
 # Load data
 # -----------------------------
-countries = pd.read_csv("data/countries.csv")
-programs = pd.read_csv("data/programs.csv")
-
-# Africa only
-africa = countries[countries["who_region"] == "AFRO"]
+section("load data")
+repo = get_repository()
+countries = repo["countries"]
+programs = as_display(repo["programs"])
 
-# Merge programs with country coordinates
-df = programs.merge(
-    africa,
-    on="country",
-    how="inner"
-)
+# Africa only, merged with country coordinates
+df = africa_program_points(programs, countries)
 
 # -----------------------------
 # Sidebar selector
 # -----------------------------
+section("sidebar selector")
 st.sidebar.header("Select Country")
 
 country_list = ["All African Countries"] + sorted(df["country"].unique().tolist())
 selected_country = st.sidebar.selectbox("Country", country_list)
 
-# -----------------------------
-# Map styling logic
-# -----------------------------
-df["highlight"] = "Normal"
-df["size"] = 8
-
-if selected_country != "All African Countries":
-    df.loc[df["country"] == selected_country, "highlight"] = "Selected"
-    df.loc[df["country"] == selected_country, "size"] = 18
-
 # -----------------------------
 # Africa FELTP Map
 # -----------------------------
-fig = px.scatter_geo(
-    df,
-    lat="lat",
-    lon="lon",
-    hover_name="country",
-    hover_data={
-        "program_name": True,
-        "network": True,
-        "modality": True,
-        "accredited": True,
-    },
-    color="highlight",
-    size="size",
-    size_max=25,
-    projection="natural earth",
-    scope="africa",
-    height=600
+# Only the full map is cached (once per data version); selecting a country
+# adds a small overlay trace to this run's copy of it.
+section("africa map figure")
+cell_degrees = map_detail_control(len(df))
+
+fig = cached_figure(
+    lambda: africa_base_map(df, cell_degrees),
+    "3_National_Programs",
+    filters=(cell_degrees,),
+    data_version=repo.version
 )
 
-fig.update_layout(
-    margin=dict(r=0, t=0, l=0, b=0),
-    legend_title_text=""
-)
+if selected_country != "All African Countries":
+    fig.add_trace(selection_overlay(fig, df, selected_country, cell_degrees))
 
+section("africa map send")
 st.plotly_chart(fig, use_container_width=True)
 
 # -----------------------------
 # Country Detail Panel
 # -----------------------------
+section("country detail")
 if selected_country != "All African Countries":
 
     st.subheader(f"🇦🇫 {selected_country} — FELTP Profile")
@@ -121,3 +109,5 @@ if selected_country != "All African Countries":
     • Regional accreditation via AFENET / GFEP  
     • Continuous professional development tracking  
     """)
+
+end_trace()
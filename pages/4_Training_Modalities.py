@@ -2,6 +2,13 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from utils.figures import cached_figure
+from utils.repository import get_repository
+from utils.table_view import table_view
+from utils.tracing import end_trace, section, start_trace
+
+start_trace("4_Training_Modalities")
+
 # --------------------------------------------------
 # Page config
 # --------------------------------------------------
@@ -10,6 +17,7 @@ st.set_page_config(
     layout="wide"
 )
 
+section("header")
 st.title("Training Modalities & System Readiness")
 
 st.markdown(
@@ -23,15 +31,16 @@ st.markdown(
 # --------------------------------------------------
 # Load data
 # --------------------------------------------------
-modalities = pd.read_csv("data/modalities.csv")
-programs = pd.read_csv("data/programs.csv")
-
-modalities.columns = modalities.columns.str.strip()
-programs.columns = programs.columns.str.strip()
+section("load data")
+repo = get_repository()
+modalities = repo["modalities"]
+programs = repo["programs"]
+program_indexes = repo.program_indexes
 
 # --------------------------------------------------
 # Validate schema (STRICT)
 # --------------------------------------------------
+section("validate schema")
 required_modality_cols = {
     "name",
     "duration_months",
@@ -43,11 +52,13 @@ missing = required_modality_cols - set(modalities.columns)
 
 if missing:
     st.error(f"modalities.csv schema mismatch. Missing columns: {missing}")
+    end_trace()
     st.stop()
 
 # --------------------------------------------------
 # SECTION 1 — Readiness Heatmap (Correct & Honest)
 # --------------------------------------------------
+section("readiness heatmap figure")
 st.subheader("System Readiness Overview")
 
 st.caption(
@@ -58,42 +69,50 @@ st.caption(
     """
 )
 
-# Normalize metrics for fair comparison
-heatmap_df = modalities.copy()
 
-heatmap_df["Duration Score"] = (
-    heatmap_df["duration_months"] /
-    heatmap_df["duration_months"].max()
-) * 100
+def build_readiness_heatmap():
+    # Normalize metrics for fair comparison
+    heatmap_df = modalities.copy()
 
-heatmap_df["Field Intensity Score"] = heatmap_df["field_based_percent"]
+    heatmap_df["Duration Score"] = (
+        heatmap_df["duration_months"] /
+        heatmap_df["duration_months"].max()
+    ) * 100
 
-heatmap_long = heatmap_df.melt(
-    id_vars=["name"],
-    value_vars=["Duration Score", "Field Intensity Score"],
-    var_name="Readiness Dimension",
-    value_name="Score"
-)
+    heatmap_df["Field Intensity Score"] = heatmap_df["field_based_percent"]
 
-fig = px.density_heatmap(
-    heatmap_long,
-    x="Readiness Dimension",
-    y="name",
-    z="Score",
-    color_continuous_scale=["red", "yellow", "green"],
-    labels={
-        "name": "Training Modality",
-        "Score": "Readiness Score"
-    }
-)
+    heatmap_long = heatmap_df.melt(
+        id_vars=["name"],
+        value_vars=["Duration Score", "Field Intensity Score"],
+        var_name="Readiness Dimension",
+        value_name="Score"
+    )
+
+    fig = px.density_heatmap(
+        heatmap_long,
+        x="Readiness Dimension",
+        y="name",
+        z="Score",
+        color_continuous_scale=["red", "yellow", "green"],
+        labels={
+            "name": "Training Modality",
+            "Score": "Readiness Score"
+        }
+    )
+
+    fig.update_layout(height=420)
+    return fig
 
-fig.update_layout(height=420)
 
+fig = cached_figure(build_readiness_heatmap, "4_Training_Modalities", data_version=repo.version)
+
+section("readiness heatmap send")
 st.plotly_chart(fig, use_container_width=True)
 
 # --------------------------------------------------
 # SECTION 2 — Programs by Modality (CORRECT LINKAGE)
 # --------------------------------------------------
+section("programs by modality")
 st.subheader("Programs Implementing Each Modality")
 
 selected_modality = st.selectbox(
@@ -101,24 +120,25 @@ selected_modality = st.selectbox(
     sorted(modalities["name"].unique())
 )
 
-filtered_programs = programs[
-    programs["modality"].str.upper() == selected_modality.upper()
-]
+modality_positions = program_indexes["modality"].positions(selected_modality)
 
-if filtered_programs.empty:
+if len(modality_positions) == 0:
     st.warning("No programs mapped to this modality.")
 else:
-    st.dataframe(
-        filtered_programs[
-            [
-                "program_name",
-                "country",
-                "discipline",
-                "network",
-                "established",
-                "accredited"
-            ]
-        ].sort_values("established"),
+    table_view(
+        programs,
+        [
+            "program_name",
+            "country",
+            "discipline",
+            "network",
+            "established",
+            "accredited"
+        ],
+        key="modality_programs",
+        positions=modality_positions,
+        cache_key=("programs", repo.version),
+        sort_by="established",
         use_container_width=True,
         hide_index=True
     )
@@ -126,6 +146,7 @@ else:
 # --------------------------------------------------
 # SECTION 3 — Interpretation
 # --------------------------------------------------
+section("interpretation")
 st.markdown("### Interpretation for Decision-Makers")
 
 st.markdown(
@@ -145,3 +166,5 @@ st.markdown(
     - Governance and assessment mechanisms complete readiness
     """
 )
+
+end_trace()
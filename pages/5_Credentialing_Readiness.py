@@ -1,11 +1,29 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import plotly.express as px
+
+from utils.credentialing_logic import (
+    decode_outcomes,
+    eligibility_sweep,
+    failing_rules,
+)
+from utils.credentialing_rules import get_plan
+from utils.credentialing_store import credentialing_results
+from utils.figures import cached_figure
+from utils.repository import get_repository
+from utils.table_view import table_view
+from utils.tracing import end_trace, section, start_trace
+from utils.worker_pool import run_job
+
+start_trace("5_Credentialing_Readiness")
 
 # ==================================================
 # PAGE CONFIG
 # ==================================================
 st.set_page_config(layout="wide")
 
+section("header")
 st.header("🎓 Credentialing Readiness Explorer")
 
 st.markdown(
@@ -21,80 +39,53 @@ and can be refined during pilots.
 # ==================================================
 # LOAD DATA
 # ==================================================
-programs = pd.read_csv("data/programs.csv")
-modalities = pd.read_csv("data/modalities.csv")
-institutions = pd.read_csv("data/institutions.csv")
-
-# ==================================================
-# MODALITY LOOKUP (SCHEMA SAFE)
-# ==================================================
-modality_lookup = {
-    row["modality_id"]: {
-        "name": row["name"],
-        "duration_months": row["duration_months"],
-        "field_based_percent": row["field_based_percent"]
-    }
-    for _, row in modalities.iterrows()
-}
-
-# ==================================================
-# ELIGIBILITY EVALUATION LOGIC
-# ==================================================
-def evaluate_program_eligibility(row):
-    reasons = []
-    actions = []
-
-    modality = row["modality"]
-    accredited = row["accredited"]
-    host = row["host_institution"]
-
-    # Rule 1 — Modality existence
-    if modality not in modality_lookup:
-        return "Not Eligible", ["Unrecognized training modality"], ["Standardize modality classification"]
-
-    modality_meta = modality_lookup[modality]
-
-    # Rule 2 — Training depth
-    if modality_meta["duration_months"] < 18:
-        reasons.append("Training duration below professional credentialing threshold")
-        actions.append("Upgrade to advanced-level training")
-
-    # Rule 3 — Field exposure
-    if modality_meta["field_based_percent"] < 60:
-        return "Not Eligible", ["Insufficient field-based training"], ["Increase supervised field deployment"]
-    elif modality_meta["field_based_percent"] < 70:
-        reasons.append("Field exposure below optimal threshold")
-        actions.append("Strengthen field mentorship structure")
-
-    # Rule 4 — Accreditation
-    if accredited != "Yes":
-        reasons.append("Program not formally accredited")
-        actions.append("Pursue FETP/FELTP accreditation")
-
-    # Rule 5 — Host institution
-    if pd.isna(host) or host.strip() == "":
-        return "Not Eligible", ["No accountable host institution"], ["Establish institutional oversight"]
-
-    # Final decision
-    if len(reasons) == 0:
-        status = "Eligible"
-    else:
-        status = "Conditionally Eligible"
-
-    return status, reasons, actions
-
-# ==================================================
-# APPLY LOGIC
-# ==================================================
-results = programs.apply(evaluate_program_eligibility, axis=1)
-
-programs["Eligibility Status"] = results.apply(lambda x: x[0])
-programs["Eligibility Reasons"] = results.apply(lambda x: "; ".join(x[1]))
-programs["Recommended Actions"] = results.apply(lambda x: "; ".join(x[2]))
+section("load data")
+repo = get_repository()
+programs = repo["programs"]
+program_indexes = repo.program_indexes
+institutions = repo["institutions"]
+
+# ==================================================
+# ELIGIBILITY EVALUATION (VECTORIZED, ONE PASS)
+# ==================================================
+section("eligibility evaluation")
+plan = get_plan()
+# Stored results (nightly batch run or last refresh) are reused; only
+# programs whose inputs changed are re-evaluated, once per data version
+with st.spinner("Evaluating program eligibility..."):
+    results, refresh = credentialing_results(repo, plan)
+
+# Shared tables are read-only: derive this page's view with assign()
+programs = programs.assign(**{
+    "Eligibility Status": results["status"],
+    "outcome_mask": results["outcome_mask"],
+})
+
+section("rules table")
+with st.expander("⚙️ Eligibility rules in force"):
+    st.caption(plan.rule_set.description)
+    st.caption(f"Last refresh (data version `{refresh.data_version}`): {refresh.describe()}.")
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "Rule": rule.id,
+                    "Effect": "Not Eligible" if rule.effect == "block" else "Conditional",
+                    "Fails when": f"{rule.input} {rule.op} {rule.value}" if rule.value is not None
+                    else f"{rule.input} {rule.op}",
+                    "Reason": rule.reason,
+                }
+                for rule in plan.rules
+            ]
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
 
 # ==================================================
 # FILTERS
 # ==================================================
+section("filters")
 st.markdown("### 🌍 Filter Programs")
 
 region = st.selectbox(
@@ -102,11 +93,13 @@ region = st.selectbox(
     sorted(programs["who_region"].unique())
 )
 
-filtered = programs[programs["who_region"] == region]
+region_positions = program_indexes["who_region"].positions(region)
+filtered = programs.take(region_positions)
 
 # ==================================================
 # SUMMARY METRICS
 # ==================================================
+section("summary metrics")
 col1, col2, col3 = st.columns(3)
 
 with col1:
@@ -118,29 +111,122 @@ with col2:
 with col3:
     st.metric("Not Eligible", (filtered["Eligibility Status"] == "Not Eligible").sum())
 
+# ==================================================
+# THRESHOLD SENSITIVITY
+# ==================================================
+section("threshold sweep")
+st.subheader(f"🎚 Threshold Sensitivity — {region}")
+
+st.caption(
+    "How many programs would qualify if the TWG moved the minimum training "
+    "duration or the field-exposure floor. Current thresholds come from the rules in force."
+)
+
+count_as = st.radio(
+    "Count as qualifying",
+    ["Eligible only", "Eligible + Conditionally Eligible"],
+    horizontal=True
+)
+
+duration_grid = np.arange(0, 37, 3)
+field_grid = np.arange(30, 95, 5)
+SWEEP_COLUMNS = ["who_region", "modality", "accredited", "host_institution"]
+
+
+def build_sensitivity_heatmap():
+    sweep = run_job(
+        eligibility_sweep, repo, {"programs": SWEEP_COLUMNS, "modalities": None},
+        duration_thresholds=duration_grid, field_thresholds=field_grid, plan=plan,
+    )
+
+    qualifying = ["Eligible"] if count_as == "Eligible only" else ["Eligible", "Conditionally Eligible"]
+    region_sweep = sweep.xs(region, level="who_region")
+    matrix = (
+        region_sweep[region_sweep.index.get_level_values("status").isin(qualifying)]
+        .groupby(level=["duration_threshold", "field_threshold"])
+        .sum()
+        .unstack("field_threshold")
+    )
+
+    fig = px.imshow(
+        matrix,
+        labels={
+            "x": "Field-exposure floor (%)",
+            "y": "Minimum duration (months)",
+            "color": "Programs"
+        },
+        text_auto=True,
+        aspect="auto",
+        color_continuous_scale="Greens"
+    )
+
+    fig.update_layout(height=520)
+    return fig
+
+
+section("sensitivity figure")
+# The sweep is part of the cached build: repeat views skip it too
+with st.spinner("Running threshold sweep..."):
+    fig = cached_figure(
+        build_sensitivity_heatmap,
+        "5_Credentialing_Readiness",
+        filters=(region, count_as, plan.rule_set),
+        data_version=repo.version
+    )
+
+section("sensitivity send")
+st.plotly_chart(fig, use_container_width=True)
+
 # ==================================================
 # TABLE VIEW
 # ==================================================
+section("readiness table")
 st.subheader(f"📋 Credentialing Readiness — {region}")
 
-st.dataframe(
-    filtered[
-        [
-            "program_name",
-            "country",
-            "modality",
-            "accredited",
-            "Eligibility Status",
-            "Eligibility Reasons",
-            "Recommended Actions"
-        ]
+rule_reasons = {rule.id: rule.reason for rule in plan.rules}
+
+failing = st.multiselect(
+    "Show only programs failing",
+    list(rule_reasons),
+    format_func=rule_reasons.get
+)
+
+table_positions = region_positions
+if failing:
+    table_positions = table_positions[failing_rules(filtered["outcome_mask"], failing, plan)]
+
+
+def with_outcome_text(page):
+    # Reason / action text is decoded only for the rows being shown
+    return page.assign(**{
+        "Eligibility Reasons": decode_outcomes(page["outcome_mask"], plan, "reasons"),
+        "Recommended Actions": decode_outcomes(page["outcome_mask"], plan, "actions"),
+    })
+
+
+section("readiness table send")
+table_view(
+    programs,
+    [
+        "program_name",
+        "country",
+        "modality",
+        "accredited",
+        "Eligibility Status",
+        "Eligibility Reasons",
+        "Recommended Actions"
     ],
+    key="readiness_programs",
+    positions=table_positions,
+    cache_key=("credentialing", repo.version, plan.rule_set),
+    derive=with_outcome_text,
     use_container_width=True
 )
 
 # ==================================================
 # TWG INTERPRETATION
 # ==================================================
+section("interpretation")
 st.markdown(
     """
 ### 🧠 TWG Interpretation
@@ -161,3 +247,5 @@ This evidence-based classification supports **transparent decision-making**
 and aligns with GFEP principles of equity, quality, and feasibility.
 """
 )
+
+end_trace()
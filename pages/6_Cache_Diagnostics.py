@@ -0,0 +1,151 @@
+from dataclasses import asdict
+
+import streamlit as st
+import pandas as pd
+
+from utils.access import is_admin
+from utils.cache import MB, all_caches
+from utils.credentialing_store import refresh_history
+from utils.repository import get_repository, repository_stats
+from utils.tracing import end_trace, section, start_trace
+
+start_trace("6_Cache_Diagnostics")
+
+if not is_admin():
+    st.warning(
+        "Cache diagnostics are restricted to the administrators listed in "
+        "FETP_ADMINS (signed-in users)."
+    )
+    end_trace()
+    st.stop()
+
+# --------------------------------------------------
+# Page config
+# --------------------------------------------------
+st.set_page_config(
+    page_title="Cache Diagnostics",
+    layout="wide"
+)
+
+section("header")
+st.title("🧰 Cache Diagnostics")
+
+st.caption(
+    "Process-wide caches shared by every session. Budgets are enforced with "
+    "LRU eviction; clearing a cache only costs a recompute on next use. "
+    "Coalesced calls are misses that waited for another session's in-flight "
+    "computation of the same entry instead of repeating it."
+)
+
+# --------------------------------------------------
+# Cache table
+# --------------------------------------------------
+section("cache table")
+caches = sorted(all_caches(), key=lambda c: c.name)
+summary = pd.DataFrame([cache.summary() for cache in caches])
+
+if summary.empty:
+    st.info("No cache has been used yet in this process.")
+else:
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Caches", len(summary))
+    with col2:
+        st.metric("Cached bytes", f"{summary['bytes'].sum() / MB:.1f} MB")
+    with col3:
+        calls = summary["hits"].sum() + summary["misses"].sum()
+        st.metric("Overall hit rate", f"{summary['hits'].sum() / calls:.0%}" if calls else "—")
+    with col4:
+        st.metric("Coalesced calls", int(summary["coalesced"].sum()))
+
+    st.dataframe(
+        summary.assign(
+            mb=summary["bytes"] / MB,
+            budget_mb=summary["max_bytes"] / MB,
+            hit_rate=(summary["hit_rate"] * 100).round(1),
+            compute_s=summary["compute_s"].round(3),
+        )[
+            [
+                "cache",
+                "entries",
+                "mb",
+                "budget_mb",
+                "ttl_s",
+                "hits",
+                "misses",
+                "coalesced",
+                "hit_rate",
+                "evictions",
+                "expirations",
+                "compute_s",
+            ]
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
+
+# --------------------------------------------------
+# Clear controls
+# --------------------------------------------------
+section("clear controls")
+st.subheader("Clear caches")
+
+cols = st.columns(4)
+for i, cache in enumerate(caches):
+    with cols[i % 4]:
+        if st.button(f"Clear {cache.name}", key=f"clear_{cache.name}"):
+            cache.clear()
+            st.rerun()
+
+if caches and st.button("Clear all caches", type="primary"):
+    for cache in caches:
+        cache.clear()
+    st.rerun()
+
+# --------------------------------------------------
+# Shared data
+# --------------------------------------------------
+section("shared data")
+st.subheader("Shared data repository")
+
+repo = get_repository()
+builds = repository_stats()
+st.caption(
+    f"Data version `{repo.version}` — parsed once per process, not evictable. "
+    f"Builds: {builds['builds']}, coalesced calls: {builds['coalesced']}."
+)
+st.dataframe(
+    pd.DataFrame(
+        [
+            {
+                "table": name,
+                "rows": len(df),
+                "mb": df.memory_usage(deep=True).sum() / MB,
+            }
+            for name, df in repo.tables.items()
+        ]
+    ),
+    use_container_width=True,
+    hide_index=True
+)
+
+# --------------------------------------------------
+# Credentialing refreshes
+# --------------------------------------------------
+section("credentialing refreshes")
+st.subheader("Credentialing result refreshes")
+st.caption("Rows re-evaluated each time the data changed (newest first); unchanged programs reuse their stored outcome.")
+
+refreshes = refresh_history()
+if not refreshes:
+    st.info("Credentialing results have not been refreshed in this process yet.")
+else:
+    st.dataframe(
+        pd.DataFrame([asdict(report) for report in refreshes]).assign(
+            seconds=lambda df: df["seconds"].round(3)
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
+
+end_trace()
@@ -0,0 +1,28 @@
+import os
+
+import streamlit as st
+
+# Who may use the diagnostics tools (profiler, cache inspection...).
+# Not an access profile (see ROLES in Navigation.py): users pick their
+# profile themselves in the welcome form. Comma-separated login emails,
+# checked against st.user when authentication (st.login) is configured;
+# "*" grants every session, for a local single-user server.
+ADMINS_ENV = "FETP_ADMINS"
+
+
+def admin_emails():
+    return {
+        email.strip().lower()
+        for email in os.environ.get(ADMINS_ENV, "").split(",")
+        if email.strip()
+    }
+
+
+def is_admin():
+    admins = admin_emails()
+    if "*" in admins:
+        return True
+    if not admins or not st.user.get("is_logged_in"):
+        return False
+    email = st.user.get("email")
+    return bool(email) and email.lower() in admins
@@ -0,0 +1,246 @@
+"""
+Batch (re-)credentialing of the whole programs registry, outside Streamlit.
+
+    python -m utils.batch_credentialing [--data-dir data] [--workers N]
+        [--programs PATH.csv|PATH.arrow] [--modalities PATH] [--out PATH.parquet]
+
+Programs are read as Arrow record batches: from the table's snapshot
+(utils/snapshots.py) when it is current, otherwise streamed from the CSV
+into a temporary Arrow file first. Chunks of CHUNK_ROWS rows are
+evaluated by a process pool (utils.credentialing_logic, same rule plan
+as the dashboard); every worker maps the Arrow file and reads only its
+own chunk, and at most 2 chunks per worker are in flight, so memory per
+worker is bounded by the chunk size whatever the registry size.
+
+The output is the persisted results file of utils/credentialing_store.py
+(one row per program in registry order, with each row's input
+fingerprint); page 5 reuses it and re-evaluates only changed programs.
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import pandas as pd
+
+from utils.cache import MB
+from utils.credentialing_logic import evaluate_programs_batch, input_fingerprints
+from utils.credentialing_rules import RULES_PATH, get_plan
+from utils.credentialing_store import PROGRAM_COLUMNS, RESULTS_PATH, results_batch, results_schema
+from utils.data_loader import DATA_DIR, SNAPSHOT_DIR, TABLE_FILES, data_version, load_table, table_snapshot
+from utils.schema import apply_schema
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+CHUNK_ROWS = 500_000
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+CSV_BLOCK_BYTES = 16 * MB
+INPUT_COLUMNS = PROGRAM_COLUMNS
+
+
+# ==================================================
+# INPUT (ARROW RECORD BATCHES)
+# ==================================================
+def _csv_to_arrow(csv_path, target, progress):
+    """Streams the input columns of a programs CSV into an Arrow IPC file."""
+    size = os.path.getsize(csv_path)
+    with pa.OSFile(str(csv_path)) as raw:
+        reader = pa_csv.open_csv(
+            raw,
+            read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=INPUT_COLUMNS,
+                column_types={col: pa.string() for col in INPUT_COLUMNS},
+            ),
+        )
+        with pa.OSFile(str(target), "wb") as sink, ipc.new_file(sink, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                progress(f"reading {Path(csv_path).name}: {min(raw.tell() / size, 1):.0%}")
+    return target
+
+
+def _chunks(batch_rows, chunk_rows):
+    """Groups consecutive record batches into [start, stop) batch ranges of ~chunk_rows rows."""
+    chunks, start, rows = [], 0, 0
+    for i, n in enumerate(batch_rows):
+        rows += n
+        if rows >= chunk_rows:
+            chunks.append((start, i + 1, rows))
+            start, rows = i + 1, 0
+    if start < len(batch_rows):
+        chunks.append((start, len(batch_rows), rows))
+    return chunks
+
+
+def _read_modalities(path):
+    if Path(path).suffix == ".arrow":
+        return pd.read_feather(path)
+    return apply_schema(pd.read_csv(path), "modalities")
+
+
+def _source_version(paths):
+    """Size + mtime fingerprint of explicitly given input files (as data_version does)."""
+    parts = [f"{Path(p).name}:{os.stat(p).st_size}:{os.stat(p).st_mtime_ns}" for p in paths]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+# ==================================================
+# WORKERS
+# ==================================================
+_worker = {}
+
+
+def _init_worker(arrow_path, modalities, rules_path):
+    _worker["source"] = ipc.open_file(pa.memory_map(str(arrow_path)))
+    _worker["modalities"] = modalities
+    _worker["plan"] = get_plan(rules_path)
+
+
+def _evaluate_chunk(start, stop):
+    """Evaluates record batches [start, stop) of the mapped input; returns one output batch."""
+    source, plan = _worker["source"], _worker["plan"]
+    table = pa.Table.from_batches([source.get_batch(i).select(INPUT_COLUMNS) for i in range(start, stop)])
+    programs = table.to_pandas()
+
+    modalities = _worker["modalities"]
+    results = evaluate_programs_batch(programs, modalities, plan)
+    return results_batch(
+        table.column("program_id").cast(pa.string()).combine_chunks(),
+        results["outcome_mask"].to_numpy(),
+        input_fingerprints(programs, modalities),
+        plan,
+    )
+
+
+# ==================================================
+# DRIVER
+# ==================================================
+def _stderr_progress(message):
+    print(f"\r{message}\033[K", end="", file=sys.stderr, flush=True)
+
+
+def run_batch(programs_path, modalities, out_path, version, rules_path=RULES_PATH,
+              workers=None, chunk_rows=CHUNK_ROWS, progress=_stderr_progress):
+    """
+    Evaluates every program of `programs_path` (CSV or Arrow snapshot) and
+    writes the Parquet results to `out_path`. Returns the number of rows.
+    """
+    workers = workers or os.cpu_count() or 1
+    plan = get_plan(rules_path)
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix="fetp-batch-") as tmp:
+        arrow_path = Path(programs_path)
+        if arrow_path.suffix != ".arrow":
+            arrow_path = _csv_to_arrow(programs_path, Path(tmp) / "programs.arrow", progress)
+
+        with pa.memory_map(str(arrow_path)) as source:
+            reader = ipc.open_file(source)
+            batch_rows = [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)]
+        chunks = _chunks(batch_rows, chunk_rows)
+        total = sum(batch_rows)
+
+        schema = results_schema(version, plan.rule_set)
+
+        tmp_out = out_path.with_suffix(f".tmp{os.getpid()}")
+        start_time = time.perf_counter()
+        done = 0
+        # Spawned workers: the parent has started Arrow's thread pools (not fork-safe)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(arrow_path, modalities, rules_path),
+        ) as pool, pq.ParquetWriter(tmp_out, schema) as writer:
+            pending = deque()
+            todo = iter(chunks)
+            max_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+            while True:
+                for start, stop, _ in todo:
+                    pending.append(pool.submit(_evaluate_chunk, start, stop))
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    break
+                # Written in registry order; later chunks keep running meanwhile
+                batch = pending.popleft().result()
+                writer.write_batch(batch)
+                done += batch.num_rows
+                elapsed = time.perf_counter() - start_time
+                rate = done / elapsed if elapsed else 0.0
+                eta = (total - done) / rate if rate else float("nan")
+                progress(f"credentialing: {done:,} / {total:,} programs ({done / total:.0%}), "
+                         f"{rate:,.0f} rows/s, ETA {eta:.0f}s")
+        os.replace(tmp_out, out_path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--snapshot-dir", type=Path, default=None,
+                        help="Snapshot directory (default: the dashboard's, or <data-dir>/.snapshots).")
+    parser.add_argument("--programs", type=Path, default=None,
+                        help="Programs CSV or Arrow snapshot (default: the data dir's programs table).")
+    parser.add_argument("--modalities", type=Path, default=None,
+                        help="Modalities CSV or Arrow snapshot (default: the data dir's modalities table).")
+    parser.add_argument("--rules", type=Path, default=None,
+                        help="Rules file (default: <data-dir>/credentialing_rules.json).")
+    parser.add_argument("--out", type=Path, default=None,
+                        help=f"Output Parquet file (default: {RESULTS_PATH} for the dashboard's data dir).")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    if not HAS_ARROW:
+        parser.error("pyarrow is required")
+
+    default_dir = args.data_dir.resolve() == DATA_DIR.resolve()
+    snapshot_dir = args.snapshot_dir or (SNAPSHOT_DIR if default_dir else args.data_dir / ".snapshots")
+    rules_path = args.rules or args.data_dir / "credentialing_rules.json"
+    out_path = args.out or (RESULTS_PATH if default_dir else snapshot_dir / RESULTS_PATH.name)
+
+    if args.programs is None and args.modalities is None:
+        # Same version string as the dashboard's repository for this data dir
+        version = data_version(args.data_dir)
+    else:
+        version = _source_version([
+            args.programs or args.data_dir / TABLE_FILES["programs"],
+            args.modalities or args.data_dir / TABLE_FILES["modalities"],
+        ])
+
+    programs_path = args.programs or (
+        table_snapshot("programs", args.data_dir, snapshot_dir)
+        or args.data_dir / TABLE_FILES["programs"]
+    )
+    modalities = (
+        _read_modalities(args.modalities) if args.modalities
+        else load_table("modalities", args.data_dir, snapshot_dir)
+    )
+
+    start = time.perf_counter()
+    rows = run_batch(programs_path, modalities, out_path, version, rules_path,
+                     workers=args.workers, chunk_rows=args.chunk_rows)
+    elapsed = time.perf_counter() - start
+    print(file=sys.stderr)
+    print(f"{rows:,} programs credentialed in {elapsed:.1f}s "
+          f"({rows / elapsed:,.0f} rows/s) -> {out_path}  [data version {version}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Process-wide, bounded caches for derived artifacts (readiness table,
+compiled rule plans, figures, ...), shared by every session.
+
+Each named cache has a byte budget, LRU eviction, an optional TTL and
+hit / miss / eviction / bytes / compute-time counters, listed on the
+admin Cache Diagnostics page. Cached values are shared, not copied:
+treat them as read-only.
+
+Misses are single-flight: while one caller computes a key, concurrent
+callers of the same key wait for its result instead of computing it
+again (counted as `coalesced`), e.g. every session right after a new
+data version lands.
+"""
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+MB = 1 << 20
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def estimate_bytes(value):
+    """Approximate in-memory size of a cached value."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            # Pointers plus the objects they point to (strings, mostly)
+            return int(value.nbytes) + sum(sys.getsizeof(v) for v in value.ravel())
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_bytes(k) + estimate_bytes(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    coalesced: int = 0      # misses served by another caller's in-flight computation
+    compute_s: float = 0.0
+
+    @property
+    def hit_rate(self):
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class _Flight:
+    """A computation in progress; concurrent callers of its key wait on `done`."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.ok = False
+        self.value = None
+        self.error = None
+
+
+class BoundedCache:
+    """
+    LRU cache bounded by `max_bytes` (and optionally `max_entries`).
+    Entries older than `ttl` seconds are recomputed on next access.
+    A single value larger than the whole budget is returned but not kept.
+    """
+
+    def __init__(self, name, max_bytes, ttl=None, max_entries=None, sizeof=estimate_bytes):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.sizeof = sizeof
+        self.stats = CacheStats()
+        self._entries = OrderedDict()     # key -> (value, nbytes, stored_at)
+        self._inflight = {}               # key -> _Flight
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def _drop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def lookup(self, key):
+        """Returns (True, value) on a hit, (False, None) otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[2] > self.ttl:
+                    self._drop(key)
+                    self.stats.expirations += 1
+                    entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, entry[0]
+
+    def store(self, key, value, compute_s=0.0):
+        nbytes = self.sizeof(value)
+        with self._lock:
+            self.stats.compute_s += compute_s
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                return value
+            self._entries[key] = (value, nbytes, time.monotonic())
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        hit, value = self.lookup(key)
+        if hit:
+            return value
+        coalesced = False
+        while True:
+            with self._lock:
+                flight = self._inflight.get(key)
+                entry = self._entries.get(key)
+                if flight is None and entry is None:
+                    flight = self._inflight[key] = _Flight()
+                    break
+                if not coalesced:
+                    self.stats.coalesced += 1
+                    coalesced = True
+                if entry is not None:
+                    # Stored by a computation that finished since the lookup
+                    return entry[0]
+            flight.done.wait()
+            if flight.ok:
+                return flight.value
+            if flight.error is not None:
+                raise flight.error
+            # The computing caller was interrupted (e.g. its session stopped): take over
+
+        try:
+            start = time.perf_counter()
+            value = self.store(key, compute(), time.perf_counter() - start)
+            flight.value, flight.ok = value, True
+            return value
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def summary(self):
+        return {
+            "cache": self.name,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_s": self.ttl,
+            "hit_rate": self.stats.hit_rate,
+            **asdict(self.stats),
+        }
+
+
+def get_cache(name, max_bytes=64 * MB, ttl=None, max_entries=None, sizeof=estimate_bytes):
+    """The process-wide cache called `name`, created on first use."""
+    with _registry_lock:
+        cache = _registry.get(name)
+        if cache is None:
+            cache = _registry[name] = BoundedCache(name, max_bytes, ttl, max_entries, sizeof)
+        return cache
+
+
+def all_caches():
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def memoize(name, max_bytes=64 * MB, ttl=None, max_entries=None):
+    """
+    Decorator caching a function's results in the named cache, keyed on its
+    (hashable) arguments. The cache is reachable as `.cache`, and `.clear()`
+    empties it.
+    """
+    cache = get_cache(name, max_bytes, ttl, max_entries)
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            return cache.get_or_compute(key, lambda: fn(*args, **kwargs))
+
+        wrapper.cache = cache
+        wrapper.clear = cache.clear
+        return wrapper
+
+    return decorate
@@ -1,63 +1,272 @@
-def evaluate_program_eligibility(program_row, modality_lookup):
+import numpy as np
+import pandas as pd
+
+from utils.credentialing_rules import OPERATORS, STATUSES, get_plan
+from utils.schema import is_yes
+
+
+def _scalar_inputs(program_row, modality_lookup):
+    modality_meta = modality_lookup.get(program_row["modality"])
+    host = program_row["host_institution"]
+    accredited = program_row["accredited"]
+    return {
+        "modality_known": np.array([modality_meta is not None]),
+        "duration_months": np.array([modality_meta["duration_months"] if modality_meta else np.nan], dtype=float),
+        "field_based_percent": np.array([modality_meta["field_based_percent"] if modality_meta else np.nan], dtype=float),
+        # Blank flags are pd.NA once schema-typed: not accredited, as in is_yes
+        "accredited": np.array([pd.notna(accredited) and accredited in (True, "Yes")]),
+        "host_present": np.array([isinstance(host, str) and host.strip() != ""]),
+    }
+
+
+def evaluate_program_eligibility(program_row, modality_lookup, plan=None):
     """
     Determines credentialing eligibility for a single FETP/FELTP program.
+    Thresholds come from the compiled rule plan (data/credentialing_rules.json).
     Returns:
         status: Eligible | Conditionally Eligible | Not Eligible
         reasons: list of strings explaining the decision
         actions: list of recommended actions (if any)
     """
+    plan = plan or get_plan()
 
-    reasons = []
-    actions = []
+    mask = plan.evaluate(_scalar_inputs(program_row, modality_lookup))
+    status = STATUSES[plan.status(mask)[0]]
 
-    modality = program_row["modality"]
-    accredited = program_row["accredited"]
-    host = program_row["host_institution"]
+    return status, plan.reasons(mask[0]), plan.actions(mask[0])
+
+
+# ==================================================
+# BATCH EVALUATION (whole programs table at once)
+# ==================================================
+def _present_mask(series):
+    values = series.astype("string").str.strip()
+    return (values.notna() & (values != "")).to_numpy(dtype=bool)
+
+
+def _modality_inputs(programs, modalities):
+    """(modality known, duration, field %) per program, joined on modality_id."""
+    pos = pd.Index(modalities["modality_id"]).get_indexer(programs["modality"])
+    known = pos >= 0
+
+    duration = modalities["duration_months"].to_numpy(dtype=float, na_value=np.nan)[pos]
+    field_pct = modalities["field_based_percent"].to_numpy(dtype=float, na_value=np.nan)[pos]
+    return known, np.where(known, duration, np.nan), np.where(known, field_pct, np.nan)
+
+
+def batch_inputs(programs, modalities):
+    """Rule inputs for every program, joined to modalities on modality_id."""
+    known, duration, field_pct = _modality_inputs(programs, modalities)
+
+    return {
+        "modality_known": known,
+        "duration_months": duration,
+        "field_based_percent": field_pct,
+        "accredited": is_yes(programs["accredited"]),
+        "host_present": _present_mask(programs["host_institution"]),
+    }
+
+
+def _text_key(series):
+    # Categorical / string / object columns hash alike (pandas hashes values)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if "" not in series.cat.categories:
+            series = series.cat.add_categories([""])
+        return series.fillna("")
+    return series.astype("string").fillna("")
+
+
+def input_fingerprints(programs, modalities):
+    """
+    uint64 hash per program of every input its eligibility depends on:
+    modality, accredited, host_institution and the referenced modality's
+    duration and field-based percentage. Raw (CSV) and schema-typed
+    tables give the same fingerprints.
+    """
+    _, duration, field_pct = _modality_inputs(programs, modalities)
+    key = pd.DataFrame({
+        "modality": _text_key(programs["modality"]).array,
+        "accredited": is_yes(programs["accredited"]),
+        "host_institution": _text_key(programs["host_institution"]).array,
+        "duration_months": duration,
+        "field_based_percent": field_pct,
+    })
+    return pd.util.hash_pandas_object(key, index=False).to_numpy()
+
+
+def _present_distinct(series):
+    # Strip / compare each distinct value once (missing values get code -1)
+    codes, uniques = pd.factorize(series)
+    present = np.append(_present_mask(pd.Series(uniques)), False)
+    return present[codes]
+
+
+def distinct_inputs(programs, modalities):
+    """
+    (rule inputs per distinct (modality, accredited, host present) tuple,
+    tuple code per program). Modality metadata is joined per tuple only.
+    """
+    modality_codes, modality_values = pd.factorize(programs["modality"])
+    n_modalities = len(modality_values) + 1     # + missing modality (code -1)
+    codes = (
+        (modality_codes + 1) * 4
+        + is_yes(programs["accredited"]) * 2
+        + _present_distinct(programs["host_institution"])
+    )
+
+    # Code space is small: O(n) renumbering instead of sorting every row
+    seen = np.zeros(n_modalities * 4, dtype=bool)
+    seen[codes] = True
+    tuples = np.flatnonzero(seen)
+    renumber = np.cumsum(seen) - 1
+
+    modality_of = np.append(np.asarray(modality_values, dtype=object), None)[tuples // 4 - 1]
+    known, duration, field_pct = _modality_inputs(pd.DataFrame({"modality": modality_of}), modalities)
+    inputs = {
+        "modality_known": known,
+        "duration_months": duration,
+        "field_based_percent": field_pct,
+        "accredited": (tuples & 2) != 0,
+        "host_present": (tuples & 1) != 0,
+    }
+    return inputs, renumber[codes]
+
+
+EVALUATION_MODES = ("distinct", "rows")
 
-    # -----------------------------
-    # Rule 1 — Training Depth
-    # -----------------------------
-    if modality not in modality_lookup:
-        return "Not Eligible", ["Unknown training modality"], ["Clarify modality"]
-
-    modality_meta = modality_lookup[modality]
-    duration = modality_meta["duration_months"]
-    field_pct = modality_meta["field_based_percent"]
-
-    if duration < 18:
-        reasons.append("Training duration below professional threshold")
-        actions.append("Upgrade to advanced-level training")
-
-    # -----------------------------
-    # Rule 2 — Field Intensity
-    # -----------------------------
-    if field_pct < 60:
-        return "Not Eligible", ["Insufficient field-based training"], ["Increase field deployment"]
-    elif field_pct < 70:
-        reasons.append("Field exposure below optimal threshold")
-        actions.append("Strengthen supervised field placements")
-
-    # -----------------------------
-    # Rule 3 — Accreditation
-    # -----------------------------
-    if accredited != "Yes":
-        reasons.append("Program not accredited")
-        actions.append("Pursue formal accreditation")
-
-    # -----------------------------
-    # Rule 4 — Host Institution
-    # -----------------------------
-    if not host or host.strip() == "":
-        return "Not Eligible", ["No accountable host institution"], ["Establish institutional oversight"]
-
-    # -----------------------------
-    # Final Decision
-    # -----------------------------
-    if len(reasons) == 0:
-        status = "Eligible"
-    elif "Insufficient field-based training" in reasons:
-        status = "Not Eligible"
+
+def evaluate_programs_batch(programs, modalities, plan=None, mode="distinct"):
+    """
+    Vectorized counterpart of evaluate_program_eligibility for a whole
+    programs table. Returns a DataFrame aligned with `programs` with columns:
+        status: Eligible | Conditionally Eligible | Not Eligible
+        outcome_mask: one bit per failed rule (see plan.lookup_table());
+            turn into text with decode_outcomes() for the rows you display
+
+    mode="distinct" evaluates each distinct (modality, accredited, host
+    present) tuple once and broadcasts the outcome back to its programs;
+    mode="rows" evaluates every row. Both give the same results.
+    """
+    if mode not in EVALUATION_MODES:
+        raise ValueError(f"mode must be one of {EVALUATION_MODES}, got {mode!r}")
+    plan = plan or get_plan()
+
+    if mode == "distinct":
+        inputs, codes = distinct_inputs(programs, modalities)
+        tuple_mask = plan.evaluate(inputs)
+        mask = tuple_mask[codes]
+        status = plan.status(tuple_mask)[codes]
     else:
-        status = "Conditionally Eligible"
+        mask = plan.evaluate(batch_inputs(programs, modalities))
+        status = plan.status(mask)
+
+    return pd.DataFrame(
+        {
+            "status": pd.Categorical.from_codes(status, categories=STATUSES),
+            "outcome_mask": mask,
+        },
+        index=programs.index,
+    )
+
+
+def decode_outcomes(masks, plan=None, kind="reasons"):
+    """
+    "; "-joined reason (or action) text for a column of outcome masks.
+    Only distinct masks are decoded, then broadcast back to the rows.
+    """
+    plan = plan or get_plan()
+    decode = plan.reasons if kind == "reasons" else plan.actions
+
+    masks = np.asarray(masks, dtype=np.uint32)
+    uniques, inverse = np.unique(masks, return_inverse=True)
+    text = np.array(["; ".join(decode(m)) for m in uniques], dtype=object)
+    return text[inverse.reshape(-1)]
+
+
+def failing_rules(masks, rule_ids, plan=None):
+    """Boolean mask of rows that fail any of the given rules."""
+    plan = plan or get_plan()
+    bits = np.uint32(sum(int(plan.bits[rule_id]) for rule_id in rule_ids))
+    return (np.asarray(masks, dtype=np.uint32) & bits) != 0
+
+
+# ==================================================
+# THRESHOLD SENSITIVITY SWEEP
+# ==================================================
+DURATION_RULE = "duration_short"
+FIELD_RULE = "field_insufficient"
+
+
+def _rule_failures(rule, values, thresholds):
+    # values: (groups,), thresholds: (grid,) -> (groups, grid)
+    return OPERATORS[rule.op](values[:, None], np.asarray(thresholds, dtype=float)[None, :])
+
+
+def eligibility_sweep(programs, modalities, duration_thresholds, field_thresholds,
+                      by="who_region", plan=None,
+                      duration_rule=DURATION_RULE, field_rule=FIELD_RULE):
+    """
+    Program counts per status for every (duration, field %) threshold pair.
+
+    Programs are first collapsed into distinct (group, duration, field %,
+    other-rule outcome) combinations; the grid is then evaluated for all of
+    them in one broadcasted computation.
+    Returns a Series indexed by (by, duration_threshold, field_threshold, status).
+    """
+    plan = plan or get_plan()
+    rules = {rule.id: rule for rule in plan.rules}
+    rule_a, rule_b = rules[duration_rule], rules[field_rule]
+
+    inputs = batch_inputs(programs, modalities)
+
+    # Outcome of every rule that is not being swept
+    blocked, conditional = plan.outcomes(inputs, exclude={duration_rule, field_rule})
+
+    group_codes, group_labels = pd.factorize(programs[by], use_na_sentinel=False)
+    a_codes, a_values = pd.factorize(inputs[rule_a.input], use_na_sentinel=False)
+    b_codes, b_values = pd.factorize(inputs[rule_b.input], use_na_sentinel=False)
+
+    key = (
+        ((group_codes.astype(np.int64) * len(a_values) + a_codes) * len(b_values) + b_codes) * 4
+        + blocked * 2 + conditional
+    )
+    uniq, counts = np.unique(key, return_counts=True)
+
+    g_cond = (uniq & 1).astype(bool)
+    g_block = (uniq & 2).astype(bool)
+    rest = uniq // 4
+    g_b = rest % len(b_values)
+    g_a = (rest // len(b_values)) % len(a_values)
+    g_group = rest // (len(b_values) * len(a_values))
+
+    fail_a = _rule_failures(rule_a, np.asarray(a_values, dtype=float)[g_a], duration_thresholds)[:, :, None]
+    fail_b = _rule_failures(rule_b, np.asarray(b_values, dtype=float)[g_b], field_thresholds)[:, None, :]
+
+    def _effect(rule, fails, effect):
+        return fails if rule.effect == effect else np.zeros_like(fails)
+
+    is_blocked = (
+        g_block[:, None, None]
+        | _effect(rule_a, fail_a, "block")
+        | _effect(rule_b, fail_b, "block")
+    )
+    is_conditional = (
+        g_cond[:, None, None]
+        | _effect(rule_a, fail_a, "condition")
+        | _effect(rule_b, fail_b, "condition")
+    )
+    status = np.where(is_blocked, 2, np.where(is_conditional, 1, 0))
+
+    # (groups, status) one-hot weighted by program counts, reduced per label
+    onehot = np.zeros((len(group_labels), len(uniq)))
+    onehot[g_group, np.arange(len(uniq))] = counts
+    totals = np.stack(
+        [onehot @ (status == s).reshape(len(uniq), -1) for s in range(len(STATUSES))],
+        axis=-1,
+    ).reshape(len(group_labels), len(duration_thresholds), len(field_thresholds), len(STATUSES))
 
-    return status, reasons, actions
+    index = pd.MultiIndex.from_product(
+        [group_labels, duration_thresholds, field_thresholds, STATUSES],
+        names=[by, "duration_threshold", "field_threshold", "status"],
+    )
+    return pd.Series(totals.ravel().astype(np.int64), index=index, name="programs")
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import operator
+import os
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import MB, memoize
+from utils.tracing import traced_cache
+
+RULES_PATH = Path(os.environ.get("FETP_DATA_DIR", "data")) / "credentialing_rules.json"
+
+# Per-program inputs every rule can be written against, and their kind
+INPUTS = {
+    "modality_known": "flag",
+    "duration_months": "number",
+    "field_based_percent": "number",
+    "accredited": "flag",
+    "host_present": "flag",
+}
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Operators valid for each kind of input ("is_false" takes no value)
+KIND_OPERATORS = {
+    "flag": {"is_false", "==", "!="},
+    "number": {"<", "<=", ">", ">=", "==", "!="},
+}
+
+EFFECTS = {"block", "condition"}
+
+STATUSES = ["Eligible", "Conditionally Eligible", "Not Eligible"]
+
+MAX_RULES = 32
+
+
+# ==================================================
+# RULE DEFINITIONS (DATA)
+# ==================================================
+@dataclass(frozen=True)
+class Rule:
+    id: str
+    effect: str
+    input: str
+    op: str
+    reason: str
+    action: str
+    value: float | None = None
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    rules: tuple
+    description: str = ""
+
+    @classmethod
+    def from_dict(cls, spec):
+        rules = tuple(Rule(**rule) for rule in spec["rules"])
+        _validate(rules)
+        return cls(rules=rules, description=spec.get("description", ""))
+
+    def fingerprint(self):
+        """Short hash of the rules and thresholds (identifies stored results)."""
+        return hashlib.sha256(repr(self.rules).encode()).hexdigest()[:16]
+
+    def with_values(self, **values):
+        """Copy of the rule set with the thresholds of the named rules replaced."""
+        unknown = set(values) - {rule.id for rule in self.rules}
+        if unknown:
+            raise ValueError(f"Unknown rule ids: {sorted(unknown)}")
+        return RuleSet(
+            rules=tuple(
+                replace(rule, value=values[rule.id]) if rule.id in values else rule
+                for rule in self.rules
+            ),
+            description=self.description,
+        )
+
+
+def _validate(rules):
+    seen = set()
+    for rule in rules:
+        if rule.id in seen:
+            raise ValueError(f"Duplicate rule id: {rule.id}")
+        seen.add(rule.id)
+        if rule.effect not in EFFECTS:
+            raise ValueError(f"{rule.id}: effect must be one of {sorted(EFFECTS)}")
+        if rule.input not in INPUTS:
+            raise ValueError(f"{rule.id}: input must be one of {sorted(INPUTS)}")
+        if rule.op != "is_false" and rule.op not in OPERATORS:
+            raise ValueError(f"{rule.id}: unsupported op {rule.op!r}")
+        kind = INPUTS[rule.input]
+        if rule.op not in KIND_OPERATORS[kind]:
+            raise ValueError(
+                f"{rule.id}: op {rule.op!r} does not apply to {kind} input {rule.input!r} "
+                f"(use one of {sorted(KIND_OPERATORS[kind])})"
+            )
+        if rule.op == "is_false":
+            if rule.value is not None:
+                raise ValueError(f"{rule.id}: op 'is_false' takes no value")
+        elif rule.value is None:
+            raise ValueError(f"{rule.id}: op {rule.op!r} needs a value")
+        elif kind == "flag" and not isinstance(rule.value, bool):
+            raise ValueError(f"{rule.id}: {rule.input!r} is a flag, compare it with true / false")
+        elif kind == "number" and (isinstance(rule.value, bool) or not isinstance(rule.value, (int, float))):
+            raise ValueError(f"{rule.id}: {rule.input!r} is a number, compare it with a number")
+
+
+# ==================================================
+# COMPILED EVALUATION PLAN
+# ==================================================
+def _compile_predicate(rule):
+    if rule.op == "is_false":
+        return lambda inputs: ~inputs[rule.input]
+    compare = OPERATORS[rule.op]
+    return lambda inputs: compare(inputs[rule.input], rule.value)
+
+
+class EvaluationPlan:
+    """
+    A rule set compiled into vectorized predicates.
+
+    Every rule owns one bit of the outcome mask, set when the rule fails,
+    so a mask answers "which rules does this program fail" for any rule.
+    Block precedence applies only when decoding: any failing blocking rule
+    makes the status Not Eligible, and the first one listed alone gives
+    the reason / action shown.
+    """
+
+    def __init__(self, rule_set):
+        if len(rule_set.rules) > MAX_RULES:
+            raise ValueError(f"At most {MAX_RULES} rules fit in the outcome mask")
+        self.rule_set = rule_set
+        self.rules = rule_set.rules
+        self.bits = {rule.id: np.uint32(1 << i) for i, rule in enumerate(self.rules)}
+        self.blocking_bits = np.uint32(sum(
+            int(self.bits[rule.id]) for rule in self.rules if rule.effect == "block"
+        ))
+        self._predicates = [(rule, _compile_predicate(rule)) for rule in self.rules]
+
+    def __reduce__(self):
+        # Compiled predicates are closures: pickle the rule set, recompile on load
+        return EvaluationPlan, (self.rule_set,)
+
+    def evaluate(self, inputs):
+        """Outcome mask (uint32) for a dict of equally sized input arrays."""
+        n_rows = len(next(iter(inputs.values())))
+        mask = np.zeros(n_rows, dtype=np.uint32)
+        for rule, predicate in self._predicates:
+            mask |= np.where(predicate(inputs), self.bits[rule.id], np.uint32(0))
+        return mask
+
+    def outcomes(self, inputs, exclude=()):
+        """(blocked, conditional) boolean arrays, ignoring the excluded rule ids."""
+        n_rows = len(next(iter(inputs.values())))
+        blocked = np.zeros(n_rows, dtype=bool)
+        conditional = np.zeros(n_rows, dtype=bool)
+        for rule, predicate in self._predicates:
+            if rule.id in exclude:
+                continue
+            if rule.effect == "block":
+                blocked |= predicate(inputs)
+            else:
+                conditional |= predicate(inputs)
+        return blocked, conditional
+
+    def status(self, mask):
+        return np.where(
+            mask & self.blocking_bits, 2, np.where(mask != 0, 1, 0)
+        ).astype(np.int8)
+
+    def lookup_table(self):
+        """Decodes each outcome-mask bit into its rule, reason and action."""
+        return pd.DataFrame(
+            [
+                {"bit": int(self.bits[rule.id]), "rule": rule.id, "effect": rule.effect,
+                 "reason": rule.reason, "action": rule.action}
+                for rule in self.rules
+            ]
+        ).set_index("bit")
+
+    def failing(self, mask):
+        """Every rule whose bit is set in one outcome mask, in listed order."""
+        return [rule for rule in self.rules if mask & self.bits[rule.id]]
+
+    def decisive(self, mask):
+        """Rules explaining one outcome: the first failing blocking rule, else every failing condition."""
+        failing = self.failing(mask)
+        return [rule for rule in failing if rule.effect == "block"][:1] or failing
+
+    def reasons(self, mask):
+        return [rule.reason for rule in self.decisive(mask)]
+
+    def actions(self, mask):
+        return [rule.action for rule in self.decisive(mask)]
+
+
+def load_rule_set(path=RULES_PATH):
+    with open(path, encoding="utf-8") as fh:
+        return RuleSet.from_dict(json.load(fh))
+
+
+@traced_cache(memoize("rule_plans", max_bytes=4 * MB, max_entries=8))
+def _compiled_plan(path, mtime_ns, size):
+    return EvaluationPlan(load_rule_set(path))
+
+
+def get_plan(path=RULES_PATH):
+    """
+    Process-wide compiled plan for a rules file, shared by every session.
+    Recompiled only when the file is modified.
+    """
+    stat = os.stat(path)
+    return _compiled_plan(str(path), stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,267 @@
+"""
+Persisted credentialing results, refreshed incrementally.
+
+One Parquet file (RESULTS_PATH) holds the outcome of every program:
+program_id, status, outcome_mask, reason_codes, reasons, actions and
+input_fingerprint, a hash of everything the row's eligibility depends on
+(utils.credentialing_logic.input_fingerprints). The metadata records
+the data version and rule-set fingerprint it was computed for.
+
+The batch CLI (utils/batch_credentialing.py) writes it for the whole
+registry. When the data changes, refresh_results() re-evaluates only the
+programs whose fingerprint changed or that are new: an edited program
+row, or every program using a modality whose thresholds changed. A new
+rule set re-evaluates everything. Each refresh is reported in
+refresh_history().
+"""
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import MB, memoize
+from utils.credentialing_logic import evaluate_programs_batch, input_fingerprints
+from utils.credentialing_rules import STATUSES, EvaluationPlan
+from utils.data_loader import SNAPSHOT_DIR
+from utils.tracing import span, traced_cache
+from utils.worker_pool import run_job
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+RESULTS_PATH = Path(os.environ.get(
+    "FETP_CREDENTIALING_RESULTS", SNAPSHOT_DIR / "credentialing_results.parquet"
+))
+META_DATA_VERSION = b"fetp.data_version"
+META_RULES = b"fetp.rules"
+META_MASK_FORMAT = b"fetp.mask_format"
+# 2: every failing rule's bit is set (1 let a blocking rule clear the others)
+MASK_FORMAT = b"2"
+# Program columns the rules read, plus the key of the results file
+PROGRAM_COLUMNS = ["program_id", "modality", "accredited", "host_institution"]
+HISTORY_SIZE = 20
+
+_history = deque(maxlen=HISTORY_SIZE)
+
+
+# ==================================================
+# FILE FORMAT
+# ==================================================
+def results_schema(version, rule_set):
+    text = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("program_id", pa.string()),
+        ("status", text),
+        ("outcome_mask", pa.uint32()),
+        ("reason_codes", text),
+        ("reasons", text),
+        ("actions", text),
+        ("input_fingerprint", pa.uint64()),
+    ], metadata={
+        META_DATA_VERSION: version.encode(),
+        META_RULES: rule_set.fingerprint().encode(),
+        META_MASK_FORMAT: MASK_FORMAT,
+    })
+
+
+def _dictionary(indices, values):
+    return pa.DictionaryArray.from_arrays(
+        pa.array(np.asarray(indices, dtype=np.int32)), pa.array(values, type=pa.string())
+    )
+
+
+def results_batch(program_ids, masks, fingerprints, plan):
+    """
+    One record batch of the results file (`program_ids`: Arrow string array).
+    Text columns hold one dictionary entry per distinct outcome:
+    reason_codes lists every failing rule, reasons / actions the ones
+    shown for the outcome (see EvaluationPlan.decisive).
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    uniques, inverse = np.unique(masks, return_inverse=True)
+    failing = [plan.failing(m) for m in uniques]
+    decisive = [plan.decisive(m) for m in uniques]
+
+    return pa.record_batch({
+        "program_id": program_ids,
+        "status": _dictionary(plan.status(masks), STATUSES),
+        "outcome_mask": pa.array(masks, type=pa.uint32()),
+        "reason_codes": _dictionary(inverse, [";".join(r.id for r in rules) for rules in failing]),
+        "reasons": _dictionary(inverse, ["; ".join(r.reason for r in rules) for rules in decisive]),
+        "actions": _dictionary(inverse, ["; ".join(r.action for r in rules) for rules in decisive]),
+        "input_fingerprint": pa.array(np.asarray(fingerprints, dtype=np.uint64), type=pa.uint64()),
+    })
+
+
+def _write_results(batch, path, version, rule_set):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    with pq.ParquetWriter(tmp, results_schema(version, rule_set)) as writer:
+        writer.write_batch(batch)
+    os.replace(tmp, path)
+
+
+def _program_ids(programs):
+    ids = pa.array(programs["program_id"].astype("string").array)
+    return ids if isinstance(ids, pa.ChunkedArray) else pa.chunked_array([ids])
+
+
+def _read_state(path, rule_set):
+    """(data version, program ids, fingerprints, masks) stored for `rule_set`, or a reason why not usable."""
+    if not Path(path).exists():
+        return "no stored results"
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        if metadata.get(META_RULES) != rule_set.fingerprint().encode():
+            return "rule set changed"
+        if metadata.get(META_MASK_FORMAT) != MASK_FORMAT:
+            return "outcome mask format changed"
+        table = pq.read_table(path, columns=["program_id", "input_fingerprint", "outcome_mask"])
+    except (OSError, ValueError, KeyError, pa.ArrowInvalid):
+        return "stored results unreadable"
+    return (
+        metadata.get(META_DATA_VERSION, b"").decode(),
+        table.column("program_id"),
+        table.column("input_fingerprint").to_numpy(),
+        table.column("outcome_mask").to_numpy(),
+    )
+
+
+def _align(stored_ids, ids):
+    """Stored row of every current program (-1 if new), or None if stored ids are ambiguous."""
+    if stored_ids.type != ids.type:
+        stored_ids = stored_ids.cast(ids.type)
+    if stored_ids.equals(ids):
+        # Same programs in the same order: the usual case, no lookup needed
+        return np.arange(len(ids))
+    stored = pd.Index(stored_ids.to_pandas())
+    if not stored.is_unique:
+        return None
+    return stored.get_indexer(ids.to_pandas())
+
+
+# ==================================================
+# INCREMENTAL REFRESH
+# ==================================================
+@dataclass
+class RefreshReport:
+    data_version: str
+    rows: int
+    recomputed: int
+    new: int = 0
+    changed: int = 0
+    removed: int = 0
+    full_reason: str = ""
+    seconds: float = 0.0
+
+    def describe(self):
+        if self.full_reason:
+            return f"all {self.rows:,} programs evaluated ({self.full_reason})"
+        if not self.recomputed:
+            return f"stored results reused for all {self.rows:,} programs"
+        return (
+            f"{self.recomputed:,} of {self.rows:,} programs re-evaluated "
+            f"({self.changed:,} changed, {self.new:,} new; {self.removed:,} removed)"
+        )
+
+
+def refresh_results(programs, modalities, plan, version, path=RESULTS_PATH):
+    """
+    status / outcome_mask for every program (aligned with `programs`),
+    reusing stored outcomes whose input fingerprint is unchanged.
+    The results file is rewritten when anything was re-evaluated.
+    Returns (results DataFrame, RefreshReport).
+    """
+    start = time.perf_counter()
+    n_rows = len(programs)
+    fingerprints = input_fingerprints(programs, modalities)
+    masks = np.zeros(n_rows, dtype=np.uint32)
+    stale = np.ones(n_rows, dtype=bool)
+    report = RefreshReport(data_version=version, rows=n_rows, recomputed=n_rows)
+
+    ids = _program_ids(programs) if HAS_ARROW else None
+    previous = _read_state(path, plan.rule_set) if HAS_ARROW else "pyarrow unavailable"
+    pos = None
+    if not isinstance(previous, str):
+        stored_version, stored_ids, stored_fingerprints, stored_masks = previous
+        pos = _align(stored_ids, ids)
+        if pos is None:
+            previous = "duplicate program ids"
+
+    if pos is None:
+        report.full_reason = previous
+        stored_version = None
+    else:
+        known = pos >= 0
+        same = known.copy()
+        same[known] = stored_fingerprints[pos[known]] == fingerprints[known]
+        masks[same] = stored_masks[pos[same]]
+        stale = ~same
+        matched = np.zeros(len(stored_ids), dtype=bool)
+        matched[pos[known]] = True
+        report.new = int((~known).sum())
+        report.changed = int((known & ~same).sum())
+        report.removed = int((~matched).sum())
+        report.recomputed = int(stale.sum())
+
+    with span("credentialing refresh", recomputed=report.recomputed, rows=n_rows):
+        rows = np.flatnonzero(stale)
+        if len(rows):
+            masks[rows] = evaluate_programs_batch(
+                programs.take(rows), modalities, plan
+            )["outcome_mask"].to_numpy()
+
+    if HAS_ARROW and (len(rows) or stored_version != version or report.removed):
+        try:
+            _write_results(
+                results_batch(ids.cast(pa.string()).combine_chunks(), masks, fingerprints, plan),
+                path, version, plan.rule_set,
+            )
+        except OSError:
+            pass
+
+    report.seconds = time.perf_counter() - start
+    results = pd.DataFrame(
+        {
+            "status": pd.Categorical.from_codes(plan.status(masks), categories=STATUSES),
+            "outcome_mask": masks,
+        },
+        index=programs.index,
+    )
+    return results, report
+
+
+def refresh_history():
+    """Most recent refreshes of this process, newest first."""
+    return list(_history)
+
+
+@traced_cache(memoize("credentialing_results", max_bytes=512 * MB, max_entries=4))
+def _current_results(version, rule_set):
+    from utils.repository import get_repository
+
+    repo = get_repository()
+    # In the worker pool: a full evaluation must not stall other sessions
+    results, report = run_job(
+        refresh_results, repo, {"programs": PROGRAM_COLUMNS, "modalities": None},
+        plan=EvaluationPlan(rule_set), version=version,
+    )
+    _history.appendleft(report)
+    return results, report
+
+
+def credentialing_results(repo, plan):
+    """
+    (results, RefreshReport) for the repository's programs under `plan`:
+    refreshed once per data version and rule set, then shared by every session.
+    """
+    return _current_results(repo.version, plan.rule_set)
@@ -1,18 +1,56 @@
+import hashlib
+import os
+from pathlib import Path
+
 import pandas as pd
-import streamlit as st
 
-@st.cache_data(show_spinner="Loading core datasets...")
-def load_all_data():
-    return {
-        "countries": pd.read_csv("data/countries.csv"),
-        "programs": pd.read_csv("data/programs.csv"),
-        "networks": pd.read_csv("data/networks.csv"),
-        "partners": pd.read_csv("data/partners.csv"),
-        "institutions": pd.read_csv("data/institutions.csv"),
-        "modalities": pd.read_csv("data/modalities.csv"),
-        "governance": pd.read_csv("data/governance_models.csv"),
-        "metrics": pd.read_csv("data/global_metrics.csv"),
-    }
+from utils.schema import apply_schema, schema_fingerprint
+from utils.snapshots import read_table, snapshot_for
+
+DATA_DIR = Path(os.environ.get("FETP_DATA_DIR", "data"))
+SNAPSHOT_DIR = Path(os.environ.get("FETP_SNAPSHOT_DIR", DATA_DIR / ".snapshots"))
+
+TABLE_FILES = {
+    "countries": "countries.csv",
+    "programs": "programs.csv",
+    "networks": "networks.csv",
+    "partners": "partners.csv",
+    "institutions": "institutions.csv",
+    "modalities": "modalities.csv",
+    "governance": "governance_models.csv",
+    "metrics": "global_metrics.csv",
+}
+
+
+def load_table(name, data_dir=DATA_DIR, snapshot_dir=SNAPSHOT_DIR):
+    return read_table(
+        Path(data_dir) / TABLE_FILES[name],
+        snapshot_dir,
+        parse=lambda path: apply_schema(pd.read_csv(path), name),
+        version=schema_fingerprint(name),
+    )
 
 
+def table_snapshot(name, data_dir=DATA_DIR, snapshot_dir=SNAPSHOT_DIR):
+    """Current Arrow snapshot of a table (as written by load_table), or None."""
+    path = snapshot_for(Path(data_dir) / TABLE_FILES[name], snapshot_dir, schema_fingerprint(name))
+    return path if path.exists() else None
+
+
+def data_version(data_dir=DATA_DIR):
+    """
+    Cheap fingerprint (file size + mtime) of every source table.
+    Derived caches key on it so they refresh when any CSV changes.
+    """
+    parts = []
+    for name, filename in TABLE_FILES.items():
+        stat = os.stat(Path(data_dir) / filename)
+        parts.append(f"{filename}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+def load_all_data():
+    """All tables from the shared repository (see utils/repository.py)."""
+    from utils.repository import get_repository
 
+    return dict(get_repository().tables)
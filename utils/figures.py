@@ -0,0 +1,38 @@
+import copy
+
+import plotly.graph_objects as go
+
+from utils.cache import MB, estimate_bytes, get_cache
+from utils.tracing import span
+
+FIGURE_CACHE_BYTES = 256 * MB
+FIGURE_CACHE_ENTRIES = 128
+
+
+def cached_figure(build, page, filters=(), data_version=""):
+    """
+    Plotly figure for `page` under the given filter values, built with
+    `build()` only the first time a (page, filters, data version) is seen.
+    The cache keeps the figure's spec (`to_dict()`, charged at its
+    in-memory size); every call returns a new Figure made from a private
+    copy of it, so callers may update their figure without affecting
+    other sessions.
+    """
+    cache = get_cache(
+        "figures",
+        max_bytes=FIGURE_CACHE_BYTES,
+        max_entries=FIGURE_CACHE_ENTRIES,
+        sizeof=estimate_bytes,
+    )
+    key = (page, tuple(filters), data_version)
+    with span(f"figure {page}", "cache", result="hit") as call:
+
+        def build_on_miss():
+            if call is not None:
+                call["result"] = "miss"
+            return build().to_dict()
+
+        # Concurrent sessions asking for the same new figure share one build
+        spec = cache.get_or_compute(key, build_on_miss)
+        # go.Figure(dict) edits the dict while it builds: never hand it the shared one
+        return go.Figure(copy.deepcopy(spec))
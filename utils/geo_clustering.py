@@ -0,0 +1,121 @@
+"""
+Server-side marker aggregation for the geo maps (pages 1-3).
+
+Above CLUSTER_THRESHOLD points (env FETP_MAP_CLUSTER_THRESHOLD) a map
+plots one marker per grid cell instead of one per row: points are
+bucketed on a lat/lon grid whose cell size follows the chosen detail
+level, and each cluster is drawn at its centroid with its count.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+CLUSTER_THRESHOLD = int(os.environ.get("FETP_MAP_CLUSTER_THRESHOLD", "5000"))
+
+# Map detail level -> grid cell size in degrees
+DETAIL_CELL_DEGREES = {
+    "World": 10.0,
+    "Region": 5.0,
+    "Country": 2.0,
+    "Province": 1.0,
+    "District": 0.25,
+}
+
+MIN_CLUSTER_MARKER = 6
+MAX_CLUSTER_MARKER = 40
+
+
+def should_cluster(n_points, threshold=CLUSTER_THRESHOLD):
+    return n_points > threshold
+
+
+def grid_clusters(lat, lon, cell_degrees):
+    """
+    Buckets points on a `cell_degrees` grid.
+    Returns (cluster id per point, centroid lat, centroid lon, counts).
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    n_cols = int(np.ceil(360.0 / cell_degrees))
+    row = np.floor((lat + 90.0) / cell_degrees).astype(np.int64)
+    col = np.floor((lon + 180.0) / cell_degrees).astype(np.int64)
+
+    cells, inverse, counts = np.unique(row * n_cols + col, return_inverse=True, return_counts=True)
+    centroid_lat = np.bincount(inverse, weights=lat, minlength=len(cells)) / counts
+    centroid_lon = np.bincount(inverse, weights=lon, minlength=len(cells)) / counts
+    return inverse, centroid_lat, centroid_lon, counts
+
+
+def cluster_points(df, cell_degrees, lat="lat", lon="lon", label=None):
+    """
+    One row per non-empty grid cell: centroid, number of points and,
+    if `label` is given, the most frequent value of that column.
+    """
+    valid = df[lat].notna() & df[lon].notna()
+    df = df[valid]
+    inverse, c_lat, c_lon, counts = grid_clusters(df[lat], df[lon], cell_degrees)
+    clusters = pd.DataFrame({"lat": c_lat, "lon": c_lon, "count": counts})
+
+    if label is not None:
+        top = (
+            pd.DataFrame({"cluster": inverse, "label": df[label].to_numpy()})
+            .value_counts()
+            .reset_index()
+            .drop_duplicates("cluster")
+            .set_index("cluster")["label"]
+        )
+        clusters["label"] = top.reindex(clusters.index).to_numpy()
+    return clusters
+
+
+def cluster_trace(clusters, name, noun="programs"):
+    """Scattergeo trace with one marker per cluster, sized by its count."""
+    counts = clusters["count"].to_numpy()
+    scale = np.sqrt(counts / counts.max()) if len(counts) else counts
+    sizes = MIN_CLUSTER_MARKER + scale * (MAX_CLUSTER_MARKER - MIN_CLUSTER_MARKER)
+
+    if "label" in clusters:
+        hover = [f"{c:,} {noun}<br>mostly {l}" for c, l in zip(counts, clusters["label"])]
+    else:
+        hover = [f"{c:,} {noun}" for c in counts]
+
+    return go.Scattergeo(
+        lat=clusters["lat"],
+        lon=clusters["lon"],
+        mode="markers+text",
+        text=[f"{c:,}" if c > 1 else "" for c in counts],
+        textfont={"size": 10},
+        hovertext=hover,
+        hoverinfo="text",
+        marker={"size": sizes, "opacity": 0.75, "line": {"width": 0.5}},
+        name=name,
+    )
+
+
+def clustered_map(df, cell_degrees, name, label=None, noun="programs",
+                  lat="lat", lon="lon", **geo_layout):
+    """Complete clustered figure; `geo_layout` takes projection / scope / height."""
+    height = geo_layout.pop("height", 600)
+    fig = go.Figure(cluster_trace(cluster_points(df, cell_degrees, lat, lon, label), name, noun))
+    fig.update_geos(**geo_layout)
+    fig.update_layout(height=height, margin=dict(r=0, t=0, l=0, b=0), legend_title_text="")
+    return fig
+
+
+def map_detail_control(n_points, default="Region", key=None):
+    """
+    Cell size for a map with `n_points` markers: None (plot every point)
+    below the threshold, otherwise the detail level picked in the slider.
+    """
+    if not should_cluster(n_points):
+        return None
+    detail = st.select_slider(
+        f"Map detail — {n_points:,} points are grouped into clusters",
+        options=list(DETAIL_CELL_DEGREES),
+        value=default,
+        key=key
+    )
+    return DETAIL_CELL_DEGREES[detail]
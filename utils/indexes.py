@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+
+class ColumnIndex:
+    """
+    Hash index over one column: maps each distinct value to the array of
+    row positions holding it. Built with one factorize + stable sort, so
+    lookups cost O(1) and slicing costs O(matching rows).
+    """
+
+    def __init__(self, series, normalize=None):
+        self.normalize = normalize
+        keys = normalize(series) if normalize else series
+        codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+        codes = np.asarray(codes)
+
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        starts = np.concatenate([[0], np.cumsum(counts)]) + (codes < 0).sum()
+
+        self._positions = {
+            key: order[starts[i]:starts[i + 1]]
+            for i, key in enumerate(uniques.tolist())
+        }
+        self._empty = np.empty(0, dtype=order.dtype)
+
+    def keys(self):
+        return list(self._positions)
+
+    def positions(self, key):
+        if self.normalize:
+            key = self.normalize(pd.Series([key])).iloc[0]
+        return self._positions.get(key, self._empty)
+
+    def take(self, frame, key):
+        """Rows of `frame` (the indexed table) whose column equals `key`."""
+        return frame.take(self.positions(key))
+
+
+def _upper(series):
+    return series.astype("string").str.upper()
+
+
+# Columns the pages filter programs on; modality matching is case-insensitive
+PROGRAM_INDEX_COLUMNS = {
+    "country": None,
+    "network": None,
+    "modality": _upper,
+    "who_region": None,
+}
+
+
+def build_program_indexes(programs):
+    return {
+        column: ColumnIndex(programs[column], normalize)
+        for column, normalize in PROGRAM_INDEX_COLUMNS.items()
+    }
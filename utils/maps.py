@@ -0,0 +1,72 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+from utils.geo_clustering import cluster_points, cluster_trace, clustered_map
+
+AFRICA_HOVER_COLUMNS = ["program_name", "network", "modality", "accredited"]
+BASE_MARKER_SIZE = 8
+SELECTED_MARKER_SIZE = 18
+
+
+def africa_program_points(programs, countries):
+    """AFRO-region programs joined to their country's coordinates (page 3 map)."""
+    africa = countries[countries["who_region"] == "AFRO"]
+    return programs.merge(
+        africa,
+        on="country",
+        how="inner"
+    )
+
+
+def africa_base_map(points, cell_degrees=None):
+    """
+    Every program marker, unselected. Built once per data version; the
+    selection is drawn on top with `selection_overlay`. With `cell_degrees`,
+    markers are grid clusters (see utils/geo_clustering.py).
+    """
+    if cell_degrees is not None:
+        return clustered_map(
+            points, cell_degrees, "Programs", label="country",
+            projection_type="natural earth", scope="africa", height=600
+        )
+
+    fig = px.scatter_geo(
+        points,
+        lat="lat",
+        lon="lon",
+        hover_name="country",
+        hover_data={column: True for column in AFRICA_HOVER_COLUMNS},
+        projection="natural earth",
+        scope="africa",
+        height=600
+    )
+
+    fig.update_traces(marker={"size": BASE_MARKER_SIZE}, name="Programs", showlegend=True)
+    fig.update_layout(
+        margin=dict(r=0, t=0, l=0, b=0),
+        legend_title_text=""
+    )
+    return fig
+
+
+def selection_overlay(base_map, points, country, cell_degrees=None):
+    """
+    One small trace with `country`'s markers, drawn on top of `base_map`
+    (added by the caller to its own copy of the base map).
+    """
+    selected = points[points["country"] == country]
+    if cell_degrees is not None:
+        return cluster_trace(cluster_points(selected, cell_degrees, label="country"), country)
+
+    base = base_map.data[0]
+    return go.Scattergeo(
+        lat=selected["lat"],
+        lon=selected["lon"],
+        hovertext=selected["country"],
+        customdata=selected[AFRICA_HOVER_COLUMNS].to_numpy(),
+        hovertemplate=base.hovertemplate,
+        mode="markers",
+        marker={"size": SELECTED_MARKER_SIZE},
+        geo=base.geo,
+        name=country,
+    )
@@ -0,0 +1,94 @@
+"""
+On-demand cProfile capture of a single rerun.
+
+An admin (FETP_ADMINS, see utils/access.py) opens a page with
+?profile=1 to arm the profiler; the next rerun of that session (e.g.
+the next widget change) runs under cProfile. The .prof file and a
+top-N cumulative-time summary are written to PROFILE_DIR and offered
+for download in the sidebar.
+
+Hooked into utils.tracing.start_trace / end_trace, which every script
+already calls at the start and end of a rerun.
+"""
+import cProfile
+import io
+import os
+import pstats
+import time
+from pathlib import Path
+
+PROFILE_DIR = Path(os.environ.get("FETP_PROFILE_DIR", "profiles"))
+PROFILE_QUERY_PARAM = "profile"
+SUMMARY_TOP_N = 40
+
+
+def _summary(profiler, top_n=SUMMARY_TOP_N):
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top_n)
+    return out.getvalue()
+
+
+def start_profile(st, name):
+    """Arms the profiler on ?profile=1, or starts it if armed by the previous rerun."""
+    from utils.access import is_admin
+
+    # A profiled rerun that never reached finish_profile() (exception)
+    leftover = st.session_state.pop("_profiler", None)
+    if leftover is not None:
+        leftover[0].disable()
+
+    if st.query_params.get(PROFILE_QUERY_PARAM) == "1":
+        del st.query_params[PROFILE_QUERY_PARAM]
+        if is_admin():
+            st.session_state["_profile_armed"] = True
+        return
+
+    if not st.session_state.pop("_profile_armed", False):
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another session's rerun is being profiled right now
+        st.session_state["_profile_armed"] = True
+        return
+    st.session_state["_profiler"] = (profiler, name)
+
+
+def finish_profile(st, sidebar=True):
+    """
+    Stops an active capture, saves it, and shows the sidebar links
+    (not from a fragment rerun: they are shown by the next full rerun).
+    """
+    from utils.access import is_admin
+
+    active = st.session_state.pop("_profiler", None)
+    if active is not None:
+        profiler, name = active
+        profiler.disable()
+        stem = PROFILE_DIR / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}"
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(f"{stem}.prof")
+        Path(f"{stem}.txt").write_text(_summary(profiler), encoding="utf-8")
+        st.session_state["_last_profile"] = str(stem)
+
+    if not sidebar or not is_admin():
+        return
+    if st.session_state.get("_profile_armed"):
+        st.sidebar.info("⏱ Profiler armed: your next interaction will be profiled.")
+    last = st.session_state.get("_last_profile")
+    if last and Path(f"{last}.prof").exists():
+        st.sidebar.caption(f"⏱ Last profile: `{Path(last).name}`")
+        st.sidebar.download_button(
+            "Download .prof",
+            Path(f"{last}.prof").read_bytes(),
+            file_name=f"{Path(last).name}.prof",
+            on_click="ignore",
+        )
+        st.sidebar.download_button(
+            "Download summary",
+            Path(f"{last}.txt").read_text(encoding="utf-8"),
+            file_name=f"{Path(last).name}.txt",
+            on_click="ignore",
+        )
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+
+from utils.cache import MB, memoize
+from utils.repository import get_repository
+from utils.schema import is_yes
+from utils.tracing import traced_cache
+from utils.worker_pool import run_job
+
+# Program maturity is measured against this year (as on the country snapshot)
+MATURITY_REFERENCE_YEAR = 2025
+
+# Program columns compute_readiness_table reads
+READINESS_COLUMNS = [
+    "country", "accredited", "tephinet_member", "established",
+    "modality", "network", "host_institution",
+]
+
+# ==================================================
+# RECOMMENDATION & INVESTMENT CODES
+# ==================================================
+RECOMMENDATIONS = {
+    "EXPAND_ACCREDITATION": (
+        "🏅 **Expand accreditation**: No accredited programs detected. "
+        "Prioritize accreditation pathways with regional or global bodies."
+    ),
+    "SCALE_ACCREDITATION": (
+        "🏅 **Scale accreditation coverage**: Some programs remain unaccredited. "
+        "Target these for phased accreditation."
+    ),
+    "ADD_MODALITIES": (
+        "🎓 **Introduce additional training modalities**: "
+        "Expand beyond a single modality (e.g., add Intermediate or Advanced levels)."
+    ),
+    "COMPLETE_MODALITY_LADDER": (
+        "🎓 **Complete modality ladder**: "
+        "Introduce the missing training tier to ensure workforce progression."
+    ),
+    "STRENGTHEN_MATURITY": (
+        "🏛 **Strengthen program maturity**: "
+        "Programs are relatively new. Focus on governance structures, faculty development, "
+        "and curriculum standardization."
+    ),
+    "REGIONAL_INTEGRATION": (
+        "🌐 **Strengthen regional integration**: "
+        "Country programs are not currently linked to regional or global FETP networks "
+        "(e.g., TEPHINET)."
+    ),
+    "REGIONAL_LEADERSHIP": (
+        "🚀 **Advance to regional leadership**: "
+        "Position the country as a regional training hub and mentorship center."
+    ),
+}
+
+INVESTMENT_PRIORITIES = {
+    "ACCREDITATION_SYSTEMS": (
+        "**Accreditation systems strengthening** — Support accreditation fees, "
+        "technical assistance, and quality assurance systems."
+    ),
+    "ACCREDITATION_SCALE_UP": (
+        "**Accreditation scale-up** — Fund phased accreditation of remaining programs."
+    ),
+    "WORKFORCE_PIPELINE": (
+        "**Workforce pipeline expansion** — Invest in Intermediate and Advanced training "
+        "modalities to strengthen career progression."
+    ),
+    "INSTITUTIONAL_CAPACITY": (
+        "**Institutional capacity building** — Support faculty development, "
+        "program governance, and curriculum standardization."
+    ),
+    "NETWORK_INTEGRATION": (
+        "**Regional & global integration** — Enable participation in networks "
+        "such as TEPHINET and GFEP initiatives."
+    ),
+    "REGIONAL_HUB": (
+        "**Regional leadership & south–south cooperation** — Fund the country "
+        "to serve as a regional training hub and mentorship center."
+    ),
+}
+
+
+def _codes(flags):
+    # flags: {code: boolean array} -> tuple of active codes per row, in declaration order
+    names = list(flags)
+    matrix = np.column_stack([np.asarray(flags[name], dtype=bool) for name in names])
+    return [tuple(name for name, on in zip(names, row) if on) for row in matrix]
+
+
+# ==================================================
+# READINESS TABLE (ALL COUNTRIES, ONE PASS)
+# ==================================================
+def compute_readiness_table(programs, countries, reference_year=MATURITY_REFERENCE_YEAR):
+    """
+    Credentialing Readiness Index for every country in one groupby pass.
+    Indexed by country; countries without programs score on zeros.
+    """
+    df = pd.DataFrame({
+        "country": programs["country"].astype(str).to_numpy(),
+        "accredited": is_yes(programs["accredited"]),
+        "tephinet": is_yes(programs["tephinet_member"]),
+        "established": pd.to_numeric(programs["established"], errors="coerce").to_numpy(dtype=float, na_value=np.nan),
+        "modality": programs["modality"].astype(object).to_numpy(),
+        "network": programs["network"].astype(object).to_numpy(),
+        "host_institution": programs["host_institution"].astype(object).to_numpy(),
+    })
+
+    def _unique_list(series):
+        return series.dropna().unique().tolist()
+
+    stats = df.groupby("country", sort=False).agg(
+        num_programs=("accredited", "size"),
+        num_accredited=("accredited", "sum"),
+        tephinet_member=("tephinet", "any"),
+        first_established=("established", "min"),
+        modalities=("modality", _unique_list),
+        networks=("network", _unique_list),
+        host_institutions=("host_institution", _unique_list),
+    )
+
+    country_index = pd.Index(countries["country"].astype(str)).append(stats.index).unique()
+    table = stats.reindex(country_index)
+    table.index.name = "country"
+
+    table["who_region"] = (
+        countries.assign(country=countries["country"].astype(str))
+        .drop_duplicates("country").set_index("country")["who_region"].astype(object)
+        .reindex(country_index)
+    )
+    table["num_programs"] = table["num_programs"].fillna(0).astype(int)
+    table["num_accredited"] = table["num_accredited"].fillna(0).astype(int)
+    table["tephinet_member"] = table["tephinet_member"].fillna(False).astype(bool)
+    for col in ["modalities", "networks", "host_institutions"]:
+        table[col] = [value if isinstance(value, list) else [] for value in table[col]]
+
+    n_modalities = table["modalities"].str.len()
+    table["num_modalities"] = n_modalities
+    table["years_active"] = (reference_year - table["first_established"]).fillna(0).astype(int)
+
+    # ---- Score components ----
+    table["maturity_score"] = np.minimum(table["years_active"] / 25 * 30, 30)
+    table["accreditation_score"] = np.where(
+        table["num_programs"] > 0,
+        table["num_accredited"] / table["num_programs"].clip(lower=1) * 30,
+        0,
+    )
+    table["modality_score"] = np.minimum(n_modalities / 3 * 20, 20)
+    table["network_score"] = np.where(table["tephinet_member"], 20, 0)
+    table["readiness_score"] = np.round(
+        table["maturity_score"] + table["accreditation_score"]
+        + table["modality_score"] + table["network_score"]
+    ).astype(int)
+
+    score = table["readiness_score"]
+    table["readiness_label"] = np.select(
+        [score >= 75, score >= 50], ["High Readiness", "Moderate Readiness"], "Emerging Readiness"
+    )
+    table["readiness_color"] = np.select([score >= 75, score >= 50], ["🟢", "🟠"], "🔴")
+
+    # ---- Recommendation codes ----
+    programs_n, accredited_n = table["num_programs"], table["num_accredited"]
+    young = table["years_active"] < 5
+    no_network = table["network_score"] == 0
+    high = score >= 75
+
+    no_accreditation = (programs_n > 0) & (accredited_n == 0)
+    table["recommendations"] = _codes({
+        "EXPAND_ACCREDITATION": no_accreditation,
+        "SCALE_ACCREDITATION": ~no_accreditation & (programs_n > accredited_n),
+        "ADD_MODALITIES": n_modalities == 1,
+        "COMPLETE_MODALITY_LADDER": n_modalities == 2,
+        "STRENGTHEN_MATURITY": young,
+        "REGIONAL_INTEGRATION": no_network,
+        "REGIONAL_LEADERSHIP": high,
+    })
+    table["investment_priorities"] = _codes({
+        "ACCREDITATION_SYSTEMS": accredited_n == 0,
+        "ACCREDITATION_SCALE_UP": (accredited_n > 0) & (accredited_n < programs_n),
+        "WORKFORCE_PIPELINE": n_modalities < 3,
+        "INSTITUTIONAL_CAPACITY": young,
+        "NETWORK_INTEGRATION": no_network,
+        "REGIONAL_HUB": high,
+    })
+
+    return table.drop(columns="first_established")
+
+
+@traced_cache(memoize("readiness_table", max_bytes=32 * MB, max_entries=4))
+def load_readiness_table(data_version):
+    """
+    Readiness table for the current datasets. `data_version` is the cache
+    key only (see utils.data_loader.data_version): a new version recomputes.
+    """
+    repo = get_repository()
+    return run_job(
+        compute_readiness_table, repo, {"programs": READINESS_COLUMNS, "countries": None}
+    )
@@ -0,0 +1,140 @@
+import functools
+import inspect
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+import pandas as pd
+
+from utils.data_loader import DATA_DIR, SNAPSHOT_DIR, TABLE_FILES, data_version, load_table
+from utils.indexes import build_program_indexes
+from utils.tracing import span
+
+# Shared frames rely on copy-on-write so derived frames never alias them
+# (always on from pandas 3)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+def _refuse(*_, **__):
+    raise TypeError(
+        "Repository tables are shared across sessions and read-only; "
+        "derive a copy with .assign() instead"
+    )
+
+
+class _ReadOnlyIndexer:
+    """.loc / .iloc / .at / .iat of a FrozenFrame: reads pass through, assignment is refused."""
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    __setitem__ = _refuse
+
+    def __call__(self, axis=None):
+        return _ReadOnlyIndexer(self._indexer(axis))
+
+
+def _no_inplace(name):
+    method = getattr(pd.DataFrame, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs.get("inplace"):
+            _refuse()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class FrozenFrame(pd.DataFrame):
+    """
+    DataFrame shared by every session. Every in-place change is refused:
+    item / indexer assignment, inplace=True, insert, pop, update, and
+    setting columns or index. Derive a new frame (assign, take, merge,
+    copy...) instead — those return plain, mutable DataFrames.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    __setitem__ = __delitem__ = _refuse
+    insert = pop = update = isetitem = _refuse
+
+    loc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.loc.fget(self)))
+    iloc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iloc.fget(self)))
+    at = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.at.fget(self)))
+    iat = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iat.fget(self)))
+
+    def __setattr__(self, name, value):
+        if name in ("columns", "index"):
+            _refuse()
+        super().__setattr__(name, value)
+
+
+for _name in dir(pd.DataFrame):
+    _method = getattr(pd.DataFrame, _name)
+    if (not _name.startswith("_") and callable(_method)
+            and "inplace" in inspect.signature(_method).parameters):
+        setattr(FrozenFrame, _name, _no_inplace(_name))
+
+
+@dataclass(frozen=True)
+class DataRepository:
+    version: str
+    tables: MappingProxyType
+    program_indexes: MappingProxyType = field(repr=False)
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+
+def build_repository(version, data_dir=DATA_DIR, snapshot_dir=SNAPSHOT_DIR):
+    tables = {
+        name: FrozenFrame(load_table(name, data_dir, snapshot_dir))
+        for name in TABLE_FILES
+    }
+    return DataRepository(
+        version=version,
+        tables=MappingProxyType(tables),
+        program_indexes=MappingProxyType(build_program_indexes(tables["programs"])),
+    )
+
+
+_lock = threading.Lock()
+_current = None
+_stats = {"builds": 0, "coalesced": 0}
+
+
+def get_repository():
+    """
+    Process-wide, read-only data repository shared by all sessions and
+    pages. Tables are parsed once per data version; every call after that
+    returns the same object (no copies). Sessions arriving while a version
+    is being parsed wait for that build (counted as coalesced).
+    """
+    global _current
+    with span("get_repository", "cache", result="hit") as call:
+        version = data_version()
+        repo = _current
+        if repo is None or repo.version != version:
+            with _lock:
+                if _current is None or _current.version != version:
+                    if call is not None:
+                        call["result"] = "miss"
+                    _current = build_repository(version)
+                    _stats["builds"] += 1
+                else:
+                    # Built by another session while this one waited for the lock
+                    _stats["coalesced"] += 1
+                repo = _current
+    return repo
+
+
+def repository_stats():
+    """Repository builds and calls that waited on another session's build."""
+    return dict(_stats)
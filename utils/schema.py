@@ -0,0 +1,189 @@
+import hashlib
+
+import pandas as pd
+
+# ==================================================
+# COLUMN TYPES
+# ==================================================
+STRING = "string"
+CATEGORY = "category"
+FLAG = "flag"          # "Yes" / "No" -> nullable boolean
+YEAR = "Int16"
+COUNT = "Int16"
+PERCENT = "float32"
+COORD = "float32"
+
+WHO_REGION = pd.CategoricalDtype(["AFRO", "AMRO", "EMRO", "EURO", "SEARO", "WPRO"])
+
+FLAG_VALUES = {"Yes": True, "No": False}
+
+# ==================================================
+# TABLE SCHEMAS (one entry per data/*.csv table)
+# ==================================================
+SCHEMAS = {
+    "countries": {
+        "country_code": STRING,
+        "country": STRING,
+        "who_region": WHO_REGION,
+        "iso3": STRING,
+        "lat": COORD,
+        "lon": COORD,
+    },
+    "programs": {
+        "program_id": STRING,
+        "program_name": STRING,
+        "country": CATEGORY,
+        "who_region": WHO_REGION,
+        "network": CATEGORY,
+        "modality": CATEGORY,
+        "discipline": CATEGORY,
+        "established": YEAR,
+        "host_institution": CATEGORY,
+        "tephinet_member": FLAG,
+        "accredited": FLAG,
+    },
+    "networks": {
+        "network_id": STRING,
+        "name": STRING,
+        "level": CATEGORY,
+        "established": YEAR,
+        "headquarters": STRING,
+        "description": STRING,
+        "latitude": COORD,
+        "longitude": COORD,
+    },
+    "partners": {
+        "partner_id": STRING,
+        "name": STRING,
+        "type": CATEGORY,
+    },
+    "institutions": {
+        "institution_id": STRING,
+        "name": STRING,
+        "type": CATEGORY,
+        "country": CATEGORY,
+    },
+    "modalities": {
+        "modality_id": STRING,
+        "name": STRING,
+        "duration_months": COUNT,
+        "field_based_percent": PERCENT,
+        "description": STRING,
+    },
+    "governance": {
+        "model_id": STRING,
+        "model_name": STRING,
+        "description": STRING,
+        "examples": STRING,
+    },
+    "metrics": {
+        "metric": STRING,
+        "value": STRING,
+        "source": CATEGORY,
+    },
+}
+
+
+def schema_fingerprint(table):
+    """Changes whenever the declared dtypes of a table change."""
+    spec = repr(sorted((col, str(dtype)) for col, dtype in SCHEMAS[table].items()))
+    return hashlib.sha256(spec.encode()).hexdigest()[:8]
+
+
+# ==================================================
+# CASTING & VALIDATION
+# ==================================================
+def _cast_flag(series, label):
+    mapped = series.astype(STRING).str.strip().map(FLAG_VALUES)
+    bad = series.notna() & mapped.isna()
+    if bad.any():
+        raise ValueError(f"{label}: expected Yes/No, got {sorted(series[bad].astype(str).unique())}")
+    return mapped.astype("boolean")
+
+
+def _cast_numeric(series, dtype, label):
+    numeric = pd.to_numeric(series, errors="coerce")
+    bad = series.notna() & numeric.isna()
+    if bad.any():
+        raise ValueError(f"{label}: non-numeric values {sorted(series[bad].astype(str).unique())}")
+    if dtype == YEAR and (numeric.dropna() % 1 != 0).any():
+        raise ValueError(f"{label}: expected whole numbers")
+    return numeric.astype(dtype)
+
+
+def _cast_category(series, dtype, label):
+    cast = series.astype(dtype)
+    if isinstance(dtype, pd.CategoricalDtype):
+        bad = series.notna() & cast.isna()
+        if bad.any():
+            raise ValueError(
+                f"{label}: unknown values {sorted(series[bad].astype(str).unique())}, "
+                f"expected one of {list(dtype.categories)}"
+            )
+    return cast
+
+
+def _cast_column(series, dtype, label):
+    if dtype == FLAG:
+        return _cast_flag(series, label)
+    if dtype in (YEAR, COUNT, PERCENT, COORD):
+        return _cast_numeric(series, dtype, label)
+    if dtype == CATEGORY or isinstance(dtype, pd.CategoricalDtype):
+        return _cast_category(series, dtype, label)
+    return series.astype(dtype)
+
+
+def apply_schema(df, table):
+    """
+    Validates a raw table against SCHEMAS[table] and returns a typed copy.
+    Raises ValueError on missing columns or values that do not fit the
+    declared type. Undeclared columns are kept as strings.
+    """
+    schema = SCHEMAS[table]
+    df = df.rename(columns=lambda c: c.strip())
+
+    missing = set(schema) - set(df.columns)
+    if missing:
+        raise ValueError(f"{table}: missing columns {sorted(missing)}")
+
+    typed = {
+        col: _cast_column(df[col], dtype, f"{table}.{col}")
+        for col, dtype in schema.items()
+    }
+    for col in df.columns:
+        if col not in typed:
+            typed[col] = df[col].astype(STRING)
+
+    return pd.DataFrame(typed, index=df.index)
+
+
+def is_yes(series):
+    """Boolean array for a Yes/No flag, raw ("Yes"/"No") or schema-typed."""
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.fillna(False).to_numpy(dtype=bool)
+    return (series == "Yes").fillna(False).to_numpy(dtype=bool)
+
+
+def as_display(df):
+    """Copy of a typed table with Yes/No flags rendered back as text."""
+    flags = [col for col in df.columns if df[col].dtype == "boolean"]
+    return df.assign(**{col: df[col].map({True: "Yes", False: "No"}) for col in flags})
+
+
+# ==================================================
+# MEMORY REPORTING
+# ==================================================
+def memory_report(raw_tables, typed_tables):
+    """Per-table deep memory use (MB) before and after typing."""
+    rows = []
+    for name, raw in raw_tables.items():
+        before = raw.memory_usage(deep=True).sum()
+        after = typed_tables[name].memory_usage(deep=True).sum()
+        rows.append({
+            "table": name,
+            "rows": len(raw),
+            "before_mb": before / 1e6,
+            "after_mb": after / 1e6,
+            "reduction": before / after if after else float("nan"),
+        })
+    return pd.DataFrame(rows)
@@ -0,0 +1,82 @@
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from utils.tracing import span
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+
+SNAPSHOT_SUFFIX = ".arrow"
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_digest(path):
+    """Content hash of a source file, used to key its snapshot."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def snapshot_path(csv_path, digest, snapshot_dir):
+    return Path(snapshot_dir) / f"{Path(csv_path).stem}-{digest}{SNAPSHOT_SUFFIX}"
+
+
+def snapshot_for(csv_path, snapshot_dir, version=""):
+    """Path of the snapshot read_table() uses for this CSV content (may not exist yet)."""
+    digest = file_digest(csv_path)
+    if version:
+        digest = hashlib.sha256(f"{digest}:{version}".encode()).hexdigest()[:16]
+    return snapshot_path(csv_path, digest, snapshot_dir)
+
+
+def _write_snapshot(df, target):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(f"{SNAPSHOT_SUFFIX}.tmp{os.getpid()}")
+    df.to_feather(tmp)
+    os.replace(tmp, target)
+
+    # Only one snapshot per source table is kept around
+    for stale in target.parent.glob(f"{target.stem.rsplit('-', 1)[0]}-*{SNAPSHOT_SUFFIX}"):
+        if stale != target:
+            stale.unlink(missing_ok=True)
+
+
+def read_table(csv_path, snapshot_dir, parse=pd.read_csv, version=""):
+    """
+    Reads a CSV through its columnar (Arrow IPC) snapshot.
+    The snapshot is rebuilt with `parse` only when the file content or
+    `version` (e.g. the table schema) changed.
+    Falls back to parsing the CSV when pyarrow is unavailable or the
+    snapshot directory is not writable.
+    """
+    with span(f"read_table {Path(csv_path).name}", "cache", result="miss") as call:
+        if not HAS_ARROW:
+            return parse(csv_path)
+
+        target = snapshot_for(csv_path, snapshot_dir, version)
+
+        if target.exists():
+            try:
+                df = pd.read_feather(target)
+                if call is not None:
+                    call["result"] = "hit"
+                return df
+            except (OSError, ValueError):
+                # Truncated / corrupt snapshot — rebuild it below
+                pass
+
+        df = parse(csv_path)
+        try:
+            _write_snapshot(df, target)
+        except OSError:
+            pass
+        return df
@@ -0,0 +1,147 @@
+"""
+Paginated, column-projected tables.
+
+Only the visible page of rows (and only the displayed columns) is sent
+to st.dataframe. Sorting and text filtering run server-side: per-column
+sort orders and a lower-cased search column are computed once per
+`cache_key` (e.g. data version) and shared by every session, so a
+filter over 500k rows costs one vectorized pass, not a re-sort.
+"""
+import zlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.cache import MB, get_cache
+from utils.schema import as_display
+
+PAGE_SIZES = [25, 50, 100, 250]
+SEARCH_SEPARATOR = "\x1f"
+
+
+def _cached(kind, cache_key, compute):
+    if cache_key is None:
+        return compute()
+    cache = get_cache("table_views", max_bytes=256 * MB)
+    return cache.get_or_compute((kind, cache_key), compute)
+
+
+def sort_order(frame, column, cache_key=None, descending=False):
+    """Row positions of `frame` sorted by `column` (NA last and ties in row order, either direction)."""
+
+    def compute():
+        codes, uniques = pd.factorize(frame[column], sort=True)
+        if descending:
+            codes = np.where(codes < 0, codes, len(uniques) - 1 - codes)
+        codes = np.where(codes < 0, len(uniques), codes)
+        return np.argsort(codes, kind="stable")
+
+    return _cached(("order", column, descending), cache_key, compute)
+
+
+def search_text(frame, columns, cache_key=None):
+    """Lower-cased concatenation of `columns` as displayed, one string per row."""
+
+    def compute():
+        shown = as_display(frame[columns])
+        parts = [shown[col].astype("string").fillna("").str.lower() for col in columns]
+        text = parts[0]
+        for part in parts[1:]:
+            text = text + SEARCH_SEPARATOR + part
+        return text.to_numpy(dtype=object)
+
+    return _cached(("search", tuple(columns)), cache_key, compute)
+
+
+def selection_id(positions):
+    """Cheap identity of a row selection (None: all rows): count + CRC of the positions."""
+    if positions is None:
+        return None
+    positions = np.ascontiguousarray(positions, dtype=np.int64)
+    return len(positions), zlib.crc32(positions)
+
+
+def select_rows(frame, positions, columns, query="", sort_by=None, descending=False, cache_key=None):
+    """Row positions of `frame` after the text filter and sort, before paging."""
+    positions = np.arange(len(frame)) if positions is None else np.asarray(positions)
+
+    query = query.strip().lower()
+    if query:
+        text = pd.Series(search_text(frame, columns, cache_key)[positions], dtype="string")
+        positions = positions[text.str.contains(query, regex=False).to_numpy(dtype=bool)]
+
+    if sort_by is not None and len(positions):
+        # Walk the precomputed full-table order, keeping the selected rows:
+        # O(table) with no sort, whatever the size of the selection
+        order = sort_order(frame, sort_by, cache_key, descending)
+        if len(positions) < len(frame):
+            selected = np.zeros(len(frame), dtype=bool)
+            selected[positions] = True
+            order = order[selected[order]]
+        positions = order
+    return positions
+
+
+def table_view(frame, columns, key, positions=None, cache_key=None, sort_by=None,
+               derive=None, page_size=50, **dataframe_kwargs):
+    """
+    Paginated view of rows `positions` of `frame` (default: all rows).
+
+    `cache_key` identifies the contents of `frame` (data version, rule set...)
+    and enables the shared sort / search caches. `derive(page)` may add
+    display-only columns to the visible page (they are not sortable).
+    """
+    base_columns = [col for col in columns if col in frame.columns]
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        query = st.text_input("Filter rows", key=f"{key}_query", placeholder="Search…")
+    with col2:
+        sort_options = ["(none)"] + base_columns
+        sort_choice = st.selectbox(
+            "Sort by",
+            sort_options,
+            index=sort_options.index(sort_by) if sort_by in sort_options else 0,
+            key=f"{key}_sort"
+        )
+    with col3:
+        descending = st.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order") == "Descending"
+    with col4:
+        size = st.selectbox(
+            "Rows",
+            PAGE_SIZES,
+            index=PAGE_SIZES.index(page_size) if page_size in PAGE_SIZES else 1,
+            key=f"{key}_size"
+        )
+
+    rows = select_rows(
+        frame,
+        positions,
+        base_columns,
+        query=query,
+        sort_by=None if sort_choice == "(none)" else sort_choice,
+        descending=descending,
+        cache_key=cache_key,
+    )
+
+    # Back to the first page whenever the row set or ordering changes
+    # (another selection of the same size included)
+    signature = (len(frame), selection_id(positions), query, sort_choice, descending, size)
+    if st.session_state.get(f"{key}_signature") != signature:
+        st.session_state[f"{key}_signature"] = signature
+        st.session_state[f"{key}_page"] = 1
+
+    n_pages = max(1, -(-len(rows) // size))
+    page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=f"{key}_page")
+
+    start = (page - 1) * size
+    visible = frame.take(rows[start:start + size])
+    if derive is not None:
+        visible = derive(visible)
+
+    st.dataframe(as_display(visible)[columns], **dataframe_kwargs)
+    st.caption(
+        f"Rows {min(start + 1, len(rows)):,}–{min(start + size, len(rows)):,} "
+        f"of {len(rows):,} (page {page} of {n_pages})"
+    )
@@ -0,0 +1,227 @@
+"""
+Per-session rerun tracing, exported as Chrome trace-event JSON
+(open the files in chrome://tracing or https://ui.perfetto.dev).
+
+Enabled for every session with FETP_TRACE=1, or for one session by
+opening the app with ?trace=1. When tracing is off each helper returns
+after a single ContextVar lookup.
+
+Scripts call `start_trace()` first, then mark their logical sections
+with `section()`; fragments are wrapped in `traced_fragment()`; library
+code wraps work in `span()`. The same entry
+points drive on-demand cProfile captures (utils/profiling.py).
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+TRACE_ENV = "FETP_TRACE"
+TRACE_DIR = Path(os.environ.get("FETP_TRACE_DIR", "traces"))
+TRACE_QUERY_PARAM = "trace"
+
+_tracer = ContextVar("fetp_tracer", default=None)
+_cache_call = ContextVar("fetp_cache_call", default=None)
+
+
+def _now_us():
+    return time.perf_counter_ns() // 1000
+
+
+class Tracer:
+    """
+    Appends complete ("X") events for one session to `path`, using the
+    JSON array format (the closing bracket is optional for trace viewers).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._run = None        # (name, start) of the current rerun
+        self._section = None    # (name, start) of the open section
+
+    def emit(self, name, cat, start, end, args=None):
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start,
+            "dur": end - start,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args or {},
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            new = not self.path.exists()
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(("[\n" if new else ",\n") + json.dumps(event))
+
+    def begin_run(self, name):
+        # A run that never reached end_run() (exception, st.stop) is dropped:
+        # its end time is unknown.
+        self._section = None
+        self._run = (name, _now_us())
+
+    def section(self, name):
+        now = _now_us()
+        self._close_section(now)
+        self._section = (name, now)
+
+    def end_run(self):
+        now = _now_us()
+        self._close_section(now)
+        if self._run is not None:
+            name, start = self._run
+            self.emit(name, "rerun", start, now)
+            self._run = None
+
+    def _close_section(self, now):
+        if self._section is not None:
+            name, start = self._section
+            self.emit(name, "section", start, now)
+            self._section = None
+
+
+def _enabled(st):
+    if os.environ.get(TRACE_ENV, "").lower() in ("1", "true", "yes"):
+        return True
+    if st.query_params.get(TRACE_QUERY_PARAM) == "1":
+        st.session_state["_trace"] = True
+    return st.session_state.get("_trace", False)
+
+
+def start_trace(name):
+    """Starts tracing this rerun of script `name` if tracing is enabled."""
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    from utils.profiling import start_profile
+
+    start_profile(st, name)
+    if not _enabled(st):
+        _tracer.set(None)
+        return
+    tracer = st.session_state.get("_tracer")
+    if tracer is None:
+        ctx = get_script_run_ctx()
+        session_id = ctx.session_id if ctx else f"pid{os.getpid()}"
+        tracer = st.session_state["_tracer"] = Tracer(TRACE_DIR / f"{session_id}.json")
+    tracer.begin_run(name)
+    _tracer.set(tracer)
+
+
+def section(name):
+    """Closes the current section of the script and opens `name`."""
+    tracer = _tracer.get()
+    if tracer is not None:
+        tracer.section(name)
+
+
+def end_trace(sidebar=True):
+    """Ends the traced rerun; call before st.stop() and at the end of a script."""
+    import streamlit as st
+
+    from utils.profiling import finish_profile
+
+    finish_profile(st, sidebar=sidebar)
+    tracer = _tracer.get()
+    if tracer is not None:
+        tracer.end_run()
+
+
+def traced_fragment(name):
+    """
+    Decorator for the body of an @st.fragment. A fragment-only rerun does
+    not execute the script top (so no start_trace()); it is traced and
+    profiled as a run of its own, `name`. During a full rerun the body is
+    part of the script's run.
+    """
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+            ctx = get_script_run_ctx()
+            if ctx is None or not ctx.fragment_ids_this_run:
+                return fn(*args, **kwargs)
+            start_trace(name)
+            result = fn(*args, **kwargs)
+            end_trace(sidebar=False)
+            return result
+
+        return run
+
+    return decorate
+
+
+class _NullSpan:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+@contextmanager
+def _span(tracer, name, cat, args):
+    start = _now_us()
+    try:
+        yield args
+    finally:
+        tracer.emit(name, cat, start, _now_us(), args)
+
+
+def span(name, cat="span", **args):
+    """
+    Times the enclosed block. Yields a dict of event args the block may
+    annotate (None when tracing is off).
+    """
+    tracer = _tracer.get()
+    if tracer is None:
+        return _NULL_SPAN
+    return _span(tracer, name, cat, args)
+
+
+def traced_cache(cache):
+    """
+    Applies `cache` (utils.cache.memoize(...), lru_cache(...), ...) to a loader and
+    records every call as a "cache" span marked hit or miss.
+    The cached function stays reachable as `.cached` (for clear()).
+    """
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def compute(*args, **kwargs):
+            call = _cache_call.get()
+            if call is not None:
+                call["result"] = "miss"
+            return fn(*args, **kwargs)
+
+        cached = cache(compute)
+
+        @functools.wraps(fn)
+        def load(*args, **kwargs):
+            tracer = _tracer.get()
+            if tracer is None:
+                return cached(*args, **kwargs)
+            call = {"result": "hit"}
+            token = _cache_call.set(call)
+            try:
+                with _span(tracer, fn.__qualname__, "cache", call):
+                    return cached(*args, **kwargs)
+            finally:
+                _cache_call.reset(token)
+
+        load.cached = cached
+        return load
+
+    return decorate
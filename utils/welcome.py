@@ -0,0 +1,55 @@
+"""
+Welcome gate support, kept free of pandas and the datasets.
+
+The gate is the first thing a new session renders. It only needs the
+handful of rows in global_metrics.csv (read with the csv module) and a
+role selector; the shared repository and readiness table are loaded in
+a background thread meanwhile, so "Proceed" usually finds them warm.
+"""
+import csv
+import os
+import threading
+from pathlib import Path
+
+# Same location as utils.data_loader.DATA_DIR (not imported: it pulls in pandas)
+DATA_DIR = Path(os.environ.get("FETP_DATA_DIR", "data"))
+METRICS_FILE = "global_metrics.csv"
+
+_metrics = {}           # (size, mtime) -> ((metric, value), ...)
+_warm_lock = threading.Lock()
+_warm_thread = None
+
+
+def load_welcome_metrics(data_dir=DATA_DIR):
+    """(metric, value) pairs of global_metrics.csv, re-read only when the file changes."""
+    path = Path(data_dir) / METRICS_FILE
+    stat = os.stat(path)
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    rows = _metrics.get(key)
+    if rows is None:
+        with open(path, newline="", encoding="utf-8") as fh:
+            rows = tuple((row["metric"], row["value"]) for row in csv.DictReader(fh))
+        _metrics.clear()
+        _metrics[key] = rows
+    return rows
+
+
+def _warm():
+    from utils.readiness import load_readiness_table
+    from utils.repository import get_repository
+
+    load_readiness_table(get_repository().version)
+
+
+def warm_data_in_background():
+    """
+    Starts loading the repository and readiness table in a daemon thread,
+    unless a warm-up is already running. Once they are loaded this only
+    checks the data version (both are cached per process).
+    """
+    global _warm_thread
+    with _warm_lock:
+        if _warm_thread is not None and _warm_thread.is_alive():
+            return
+        _warm_thread = threading.Thread(target=_warm, name="fetp-data-warmup", daemon=True)
+        _warm_thread.start()
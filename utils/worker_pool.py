@@ -0,0 +1,112 @@
+"""
+Process-wide worker pool for heavy, pure-data computations
+(eligibility refresh, readiness table, threshold sweeps).
+
+Streamlit runs every session's script in a thread of one process, so a
+long pandas / numpy computation in one session holds the GIL and stalls
+every other session's rerun. run_job() hands such a computation to a
+pool of spawned worker processes, created once per server process; the
+calling script thread waits on the future (without holding the GIL),
+usually behind an st.spinner.
+
+Jobs are module-level functions taking the tables they read as keyword
+arguments. Tables are not pickled: workers read them from the
+repository's Arrow snapshots (utils/snapshots.py), only the columns the
+job needs, and keep the most recently read ones. When a snapshot is
+missing or the pool is disabled (FETP_WORKER_POOL=0) the job runs
+in-process on the repository's frames.
+"""
+import functools
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+import pandas as pd
+
+from utils.cache import MB, memoize
+from utils.data_loader import table_snapshot
+from utils.tracing import span
+
+POOL_ENV = "FETP_WORKER_POOL"        # number of workers; 0 runs jobs in-process
+MAX_POOL_WORKERS = 4
+WORKER_TABLE_SLOTS = 8
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def pool_size():
+    if POOL_ENV in os.environ:
+        return max(int(os.environ[POOL_ENV]), 0)
+    return min(os.cpu_count() or 1, MAX_POOL_WORKERS)
+
+
+def get_pool():
+    """The shared pool (None when disabled), started on first use."""
+    global _pool
+    if _pool is None and pool_size():
+        with _pool_lock:
+            if _pool is None:
+                # Spawned, not forked: the server process runs threads (Tornado, Arrow)
+                _pool = ProcessPoolExecutor(max_workers=pool_size(), mp_context=get_context("spawn"))
+    return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ==================================================
+# WORKER SIDE
+# ==================================================
+@functools.lru_cache(maxsize=WORKER_TABLE_SLOTS)
+def _read_snapshot(path, columns):
+    # Snapshot paths embed a content digest: a cached entry is never stale
+    return pd.read_feather(path, columns=list(columns) if columns else None)
+
+
+def _run(fn, refs, kwargs):
+    frames = {name: _read_snapshot(path, columns) for name, (path, columns) in refs.items()}
+    return fn(**frames, **kwargs)
+
+
+# ==================================================
+# SUBMITTING JOBS
+# ==================================================
+@memoize("worker_snapshots", max_bytes=1 * MB, max_entries=8)
+def _snapshot_paths(version, names):
+    # table_snapshot hashes the CSVs: done once per data version
+    paths = {name: table_snapshot(name) for name in names}
+    return None if None in paths.values() else {name: str(path) for name, path in paths.items()}
+
+
+def run_job(fn, repo, tables, **kwargs):
+    """
+    fn(**{table: frame}, **kwargs) in the worker pool; blocks until it is done.
+    `tables` maps repository table names to the columns the job reads (None: all).
+    """
+    pool = get_pool()
+    paths = _snapshot_paths(repo.version, tuple(tables)) if pool else None
+    if paths is not None:
+        refs = {
+            name: (paths[name], tuple(columns) if columns else None)
+            for name, columns in tables.items()
+        }
+        with span(f"worker pool {fn.__name__}", "pool"):
+            try:
+                return pool.submit(_run, fn, refs, kwargs).result()
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory): start a fresh pool next time
+                _discard_pool(pool)
+
+    frames = {
+        name: repo[name] if columns is None else repo[name][list(columns)]
+        for name, columns in tables.items()
+    }
+    return fn(**frames, **kwargs)